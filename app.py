@@ -1,25 +1,34 @@
 import dash
-from dash import dcc, html, Input, Output, State, callback_context
+from dash import dcc, html, dash_table, Input, Output, State, ALL, callback_context, ClientsideFunction, Patch
 import dash_bootstrap_components as dbc
-import plotly.graph_objects as go
 import numpy as np
 import pandas as pd
 import h5py
 import os
-import glob
+import re
 import math
+import functools
+import contextlib
 import traceback
 import locale
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import SimpleNamespace
 
-# Set up localization
+# Logging for hot paths; debug messages cost nothing unless the level is lowered
+logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+logger = logging.getLogger(__name__)
+
+# Set up localization - the process-wide C locale is only changed when
+# APP_LOCALE asks for it
 try:
     locale_setting = os.getenv('APP_LOCALE', '')
     if locale_setting:
         locale.setlocale(locale.LC_ALL, locale_setting)
-    else:
-        locale.setlocale(locale.LC_ALL, '')
-    print(f"[INFO] Locale set to: {locale.getlocale()}")
+        print(f"[INFO] Locale set to: {locale.getlocale()}")
 except Exception as e:
     print(f"[WARNING] Failed to set locale: {str(e)}")
 
@@ -127,26 +136,37 @@ if LANGUAGE not in TRANSLATIONS:
     print(f"[WARNING] Language {LANGUAGE} not supported, defaulting to English")
     LANGUAGE = 'en'
 
+# Attribute-access translations per language, with English filling missing keys
+_LANG = {
+    lang: SimpleNamespace(**{**TRANSLATIONS['en'], **texts})
+    for lang, texts in TRANSLATIONS.items()
+}
+# Texts of the current language, e.g. T.app_title; rebound by switch_language
+T = _LANG[LANGUAGE]
+# Plain translation tables for the clientside language switch in assets/viz.js
+I18N_TEXTS = {lang: vars(texts) for lang, texts in _LANG.items()}
+
 def switch_language(new_language):
     """Properly switch the global language"""
-    global LANGUAGE
+    global LANGUAGE, T
     if new_language in TRANSLATIONS:
         LANGUAGE = new_language
+        T = _LANG[new_language]
         print(f"[INFO] Language switched to: {LANGUAGE}")
         return True
     return False
 
+def i18n_text(key, index=0):
+    """T.<key> as a span the language buttons relabel; index tells apart spans of the same key."""
+    return html.Span(getattr(T, key), id={'type': 'i18n-text', 'key': key, 'index': index})
+
+def i18n_title(key, component):
+    """component with the tooltip T.<key>, held by a span the language buttons relabel."""
+    return html.Span(component, title=getattr(T, key), id={'type': 'i18n-title', 'key': key})
+
 def _(key, *args):
     """Get translated text using current global language"""
-    global LANGUAGE
-    if key not in TRANSLATIONS[LANGUAGE]:
-        if key in TRANSLATIONS['en']:
-            text = TRANSLATIONS['en'][key]
-        else:
-            return key
-    else:
-        text = TRANSLATIONS[LANGUAGE][key]
-    
+    text = getattr(T, key, key)
     if args:
         return text.format(*args)
     return text
@@ -163,8 +183,90 @@ BENDING_ACTUAL_COLOR = "#FF6666"
 PROFILE_REF_COLOR = "#00AA00"
 PROFILE_ACTUAL_COLOR = "#66CC66"
 
+# Combined graph trace groups in drawing order: (data type, reference name, actual name,
+# reference color, actual color, y axis)
+COMBINED_TRACE_GROUPS = (
+    ('screwdown', 'Sollprofil', 'Istprofil', SCREWDOWN_REF_COLOR, SCREWDOWN_ACTUAL_COLOR, 'y'),
+    ('profile', 'Sollanstellung', 'Istanstellung', PROFILE_REF_COLOR, PROFILE_ACTUAL_COLOR, 'y'),
+    ('bending', 'Sollbiegung', 'Istbiegung', BENDING_REF_COLOR, BENDING_ACTUAL_COLOR, 'y2'),
+)
+
+# Individual graph series per tab: (reference name, actual name, reference color, actual color, title)
+TAB_SERIES = {
+    'screwdown': ('Sollprofil', 'Istprofil', SCREWDOWN_REF_COLOR, SCREWDOWN_ACTUAL_COLOR, 'Screwdown'),
+    'bending': ('Sollbiegung', 'Istbiegung', BENDING_REF_COLOR, BENDING_ACTUAL_COLOR, 'Bending'),
+    'profile': ('Sollanstellung', 'Istanstellung', PROFILE_REF_COLOR, PROFILE_ACTUAL_COLOR, 'Profile'),
+}
+
+# Axis settings shared by every graph; only titles and ranges vary per call
+AXIS_GRID = dict(showgrid=True, gridwidth=1, gridcolor='lightgray')
+AXIS_Y2 = dict(overlaying="y", side="right")
+
+# Combined graph axis ranges per zoom preset, also applied clientside by assets/viz.js
+COMBINED_ZOOM_RANGES = {
+    'default': {'xaxis': [0, 1500], 'yaxis': [-1000, 2000], 'yaxis2': [-600, 600]},
+    'zoom_in': {'xaxis': [200, 1300], 'yaxis': [-750, 1750], 'yaxis2': [-450, 450]},
+    'zoom_out': {'xaxis': [-200, 1700], 'yaxis': [-1250, 2250], 'yaxis2': [-750, 750]},
+}
+
+# Table series per tab as (column prefix, data type); the all data tab interleaves them per point
+TABLE_SERIES = {
+    'screwdown': (('SD', 'screwdown'),),
+    'bending': (('BD', 'bending'),),
+    'profile': (('PD', 'profile'),),
+    'all_data': (('SD', 'screwdown'), ('BD', 'bending'), ('PD', 'profile')),
+}
+# Data points shown per series in the table
+TABLE_MAX_POINTS = 25
+
+# Data table styles, shared by every render; only the selected-row highlight varies
+SELECTED_ROW_COLOR = "#e6f7ff"
+TABLE_CELL_STYLE = {
+    "padding": "8px",
+    "textAlign": "center",
+    "border": f"1px solid {BORDER_COLOR}",
+    "color": "black",
+    "minWidth": "120px"
+}
+TABLE_CELL_CONDITIONAL = [
+    {"if": {"column_id": "index"}, "minWidth": "60px", "width": "60px",
+     "fontWeight": "bold", "cursor": "pointer"},
+    {"if": {"column_id": "blank_info"}, "minWidth": "100px", "width": "100px"},
+    {"if": {"column_id": "values"}, "minWidth": "80px", "width": "80px", "fontWeight": "bold"},
+]
+TABLE_HEADER_STYLE = {"fontWeight": "bold", "backgroundColor": "#f8f9fa"}
+# Records alternate reference / actual, so the series colors go by row position
+TABLE_ROW_COLORS = [
+    {"if": {"row_index": "even"}, "backgroundColor": REF_COLOR},
+    {"if": {"row_index": "odd"}, "backgroundColor": ACTUAL_COLOR},
+    {"if": {"column_id": ["index", "blank_info"]}, "backgroundColor": "white"},
+]
+TABLE_CONTAINER_STYLE = {
+    "overflowX": "auto",
+    "width": "100%",
+    "maxWidth": "100vw",
+    "paddingBottom": "15px",
+    "maxHeight": "70vh",
+    "overflowY": "auto",
+    "margin": "0",
+    "padding": "0"
+}
+
+# HDF5 chunk cache used when reading measurement data (default is only 1 MiB)
+H5_CHUNK_CACHE_BYTES = 64 * 1024 * 1024
+H5_CHUNK_CACHE_SLOTS = 1_000_003
+
+# First run of digits in a coil name, used to order coils numerically
+_DIGIT_RE = re.compile(r'\d+')
+
 # Dynamic coil blank info ranges - calculated based on actual data
 COIL_BLANK_INFO_RANGES = {}
+# Blank info numbers of all coils in the loaded file; each coil gets a slice of it
+ALL_BLANK_INFO = np.array([], dtype=np.int32)
+# First blank info number not yet assigned to any coil
+NEXT_BLANK_INFO_START = 1
+# Guards the blank info globals above; coils are also loaded by the prefetch thread
+_BLANK_INFO_LOCK = threading.Lock()
 
 class Config:
     def __init__(self):
@@ -182,11 +284,19 @@ class Config:
         self.h5_files_dir = os.getenv('H5_DATA_DIR', './data')
         self.additional_search_paths = [os.getenv("H5_SEARCH_DIR", "./data")]
         self.data_rows = None
-        self.rows_per_page = 10
+        self.rows_per_page = 5  # table rows rendered at a time; only this window is ever in the DOM
         self.display_points = 3
+        self.downsample_block = 1  # average every N columns of actual data on load; 1 disables
         self.debug_mode = False
+        self.h5_structure_cache = {}  # file_path -> (mtime_ns, structure) from scan_h5_structure
+        self.cache_max_coils = 8  # loaded coils kept in memory by load_coil_data_cached
+        self.prefetch_coils = False  # load the other coils of a file in the background after it opens
+        self.max_trace_points = 2000  # actual traces longer than this are reduced with LTTB; 0 disables
+        self.store_window_rows = 3  # actual rows sent to the browser at a time: the selected row and its neighbours
 
 config = Config()
+if config.debug_mode:
+    logger.setLevel(logging.DEBUG)
 
 # Global data store
 data_store = {}
@@ -196,79 +306,183 @@ error_message = None
 available_coils = ["coil 50", "coil 51", "coil 52"]
 selected_coil = "coil 50"
 selected_row = 0  # Global selected_row variable
-
-def calculate_coil_ranges(file_path, available_coils):
-    """Dynamically calculate blank info ranges for all coils based on actual data"""
-    global COIL_BLANK_INFO_RANGES
+DATA_VERSION = 0  # Bumped on every successful load; keys the figure caches
+_COIL_CACHE = OrderedDict()  # (file_path, mtime_ns, coil) -> loaded coil data, least recently used first
+_COIL_CACHE_LOCK = threading.Lock()  # _COIL_CACHE is shared with the prefetch thread
+_COIL_LOADING = {}  # cache key -> threading.Event set once the coil being loaded is done
+_PREFETCH_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix='coil-prefetch')
+
+def coil_sort_key(coil_name):
+    """Sort key ordering coil names by their number, e.g. 'coil 50' -> 50."""
+    match = _DIGIT_RE.search(coil_name)
+    return int(match.group()) if match else 0
+
+def open_h5_file(file_path):
+    """Open an H5 file read-only with an enlarged chunk cache."""
+    return h5py.File(file_path, 'r',
+                     rdcc_nbytes=H5_CHUNK_CACHE_BYTES,
+                     rdcc_nslots=H5_CHUNK_CACHE_SLOTS,
+                     libver='latest')
+
+def h5_file_context(file_path, h5=None):
+    """Context manager yielding h5 when the caller already holds the file open, else opening file_path."""
+    if h5 is not None:
+        return contextlib.nullcontext(h5)
+    return open_h5_file(file_path)
+
+def calculate_coil_ranges(file_path, available_coils, structure=None, h5=None):
+    """Dynamically calculate blank info ranges for all coils from their dataset shapes"""
+    global COIL_BLANK_INFO_RANGES, ALL_BLANK_INFO, NEXT_BLANK_INFO_START
     
     if not available_coils:
         return
     
-    COIL_BLANK_INFO_RANGES = {}
-    current_start = 1
-    
     print(f"[INFO] Calculating dynamic ranges for coils: {available_coils}")
     
     # Sort coils by numeric value to ensure consistent ordering
-    def extract_coil_number(coil_name):
-        numbers = ''.join(filter(str.isdigit, coil_name))
-        return int(numbers) if numbers else 0
+    sorted_coils = sorted(available_coils, key=coil_sort_key)
     
-    sorted_coils = sorted(available_coils, key=extract_coil_number)
-    
-    for coil_name in sorted_coils:
-        try:
-            # Load data for this coil to get actual row count
-            coil_data = load_data_from_h5_dynamic(file_path, coil_name)
-            
-            if coil_data and any(coil_data.values()):
-                # Get the actual number of rows for this coil
+    rows_per_coil = {}
+    with h5_file_context(file_path, h5) as f:
+        if structure is None:
+            structure = scan_h5_structure(file_path, f)
+        
+        for coil_name in sorted_coils:
+            try:
+                data_paths = structure["data_paths"].get(coil_name)
+                if data_paths is None:
+                    data_paths = _match_coil_data_paths(structure, coil_name)
+                
+                # Row counts come from the dataset headers; no data is read here.
+                # 1D datasets are loaded as a single row.
                 num_rows = 0
-                for key in ["screwdown", "bending", "profile"]:
-                    if coil_data.get(key) and "actual_x" in coil_data[key]:
-                        num_rows = max(num_rows, coil_data[key]["actual_x"].shape[0])
+                for data_path in data_paths.values():
+                    shape = f[data_path]['x'].shape
+                    num_rows = max(num_rows, shape[0] if len(shape) > 1 else 1)
                 
                 if num_rows > 0:
-                    end_num = current_start + num_rows - 1
-                    COIL_BLANK_INFO_RANGES[coil_name] = {
-                        "start": current_start,
-                        "end": end_num,
-                        "count": num_rows
-                    }
-                    
-                    print(f"[INFO] {coil_name}: {current_start}-{end_num} ({num_rows} rows)")
-                    current_start = end_num + 1
+                    rows_per_coil[coil_name] = num_rows
                 else:
-                    print(f"[WARNING] No valid data found for {coil_name}, skipping")
-            else:
-                print(f"[WARNING] No data found for {coil_name}, skipping")
-                
-        except Exception as e:
-            print(f"[ERROR] Error calculating range for {coil_name}: {e}")
+                    print(f"[WARNING] No data found for {coil_name}, skipping")
+                    
+            except Exception as e:
+                print(f"[ERROR] Error calculating range for {coil_name}: {e}")
+    
+    if not rows_per_coil:
+        with _BLANK_INFO_LOCK:
+            COIL_BLANK_INFO_RANGES = {}
+            ALL_BLANK_INFO = np.array([], dtype=np.int32)
+            NEXT_BLANK_INFO_START = 1
+        return
+    
+    # Consecutive numbering across coils: each coil starts after the previous one ends
+    sizes = np.array(list(rows_per_coil.values()))
+    ends = np.cumsum(sizes)
+    starts = ends - sizes + 1
+    all_blank_info = np.arange(1, int(ends[-1]) + 1, dtype=np.int32)
+    
+    # Each coil keeps a view of its slice of ALL_BLANK_INFO, no per-coil allocation
+    ranges = {
+        coil_name: {
+            "start": int(start),
+            "end": int(end),
+            "count": int(count),
+            "data": all_blank_info[start - 1:end]
+        }
+        for coil_name, start, end, count in zip(rows_per_coil, starts, ends, sizes)
+    }
+    with _BLANK_INFO_LOCK:
+        ALL_BLANK_INFO = all_blank_info
+        NEXT_BLANK_INFO_START = int(ends[-1]) + 1
+        COIL_BLANK_INFO_RANGES = ranges
     
-    print(f"[INFO] Final coil ranges: {COIL_BLANK_INFO_RANGES}")
+    if config.debug_mode:
+        for coil_name, info in ranges.items():
+            print(f"[DEBUG] {coil_name}: {info['start']}-{info['end']} ({info['count']} rows)")
+
+# Files below this size cannot hold real measurement data
+MIN_H5_FILE_SIZE = 1024
+
+# HDF5 format signature; it sits at offset 0 or, after a user block, at 512, 1024, 2048, ...
+H5_SIGNATURE = b'\x89HDF\r\n\x1a\n'
+H5_SIGNATURE_OFFSETS = (0, 512, 1024, 2048, 4096, 8192)
 
-def validate_h5_file(file_path):
-    """Quick validation to check if H5 file is readable and has expected structure."""
+@functools.lru_cache(maxsize=256)
+def _validate_h5_file_cached(file_path, mtime_ns):
+    """Check the HDF5 signature once per (path, mtime).
+    
+    Only the signature bytes are read; the file is opened with h5py when it is loaded.
+    """
     try:
-        with h5py.File(file_path, 'r') as f:
-            if len(f.keys()) == 0:
-                return False, "Empty H5 file"
-            
-            file_size = os.path.getsize(file_path)
-            if file_size < 1024:
-                return False, "File too small"
-            
-            return True, "Valid"
+        with open(file_path, 'rb') as fp:
+            for offset in H5_SIGNATURE_OFFSETS:
+                fp.seek(offset)
+                signature = fp.read(len(H5_SIGNATURE))
+                if signature == H5_SIGNATURE:
+                    return True, "Valid"
+                if len(signature) < len(H5_SIGNATURE):
+                    break
+        
+        return False, "Invalid H5 file: missing HDF5 signature"
     
-    except Exception as e:
+    except OSError as e:
         return False, f"Invalid H5 file: {str(e)}"
 
-def find_h5_files_improved():
-    """Improved H5 file discovery with proper deduplication and filtering."""
-    h5_files = []
-    seen_filenames = set()
+def validate_h5_file(file_path, file_stat=None):
+    """Quick validation to check if H5 file is readable and has expected structure.
+    
+    file_stat may carry a stat result the caller already has (e.g. from os.scandir).
+    """
+    try:
+        if file_stat is None:
+            file_stat = os.stat(file_path)
+    except OSError as e:
+        return False, f"Invalid H5 file: {str(e)}"
     
+    # Size check first: too-small files are rejected without being opened
+    if file_stat.st_size < MIN_H5_FILE_SIZE:
+        return False, "File too small"
+    
+    return _validate_h5_file_cached(file_path, file_stat.st_mtime_ns)
+
+# Directory listings keyed by search dir: {search_dir: (dir mtime_ns, [h5 paths])}
+_H5_FILE_CACHE = {}
+# Basename -> full path index rebuilt on every scan, used by find_file_path
+_H5_PATH_INDEX = {}
+
+def _list_h5_dir(search_dir):
+    """List the .h5 files of a directory as (path, stat result) pairs.
+    
+    The file names are reused while the directory mtime is unchanged; the stat
+    results are always current so in-place file changes are still noticed.
+    """
+    dir_mtime = os.stat(search_dir).st_mtime_ns
+    cached = _H5_FILE_CACHE.get(search_dir)
+    if cached is not None and cached[0] == dir_mtime:
+        found_files = []
+        for file_path in cached[1]:
+            try:
+                found_files.append((file_path, os.stat(file_path)))
+            except OSError:
+                continue
+        return found_files
+    
+    # DirEntry.stat() is served from the directory listing on Windows
+    with os.scandir(search_dir) as entries:
+        found_files = sorted(
+            ((entry.path, entry.stat()) for entry in entries
+             if entry.name.lower().endswith('.h5') and entry.is_file()),
+            key=lambda item: item[0]
+        )
+    
+    _H5_FILE_CACHE[search_dir] = (dir_mtime, [file_path for file_path, _stat in found_files])
+    return found_files
+
+# Result of the last full scan: key, unique h5 paths and the paths rejected as invalid
+_H5_SCAN_CACHE = {}
+
+def h5_search_dirs():
+    """Existing directories searched for H5 files, in priority order."""
     search_dirs = [
         os.getenv('H5_DATA_DIR', './data'),
         './data',
@@ -276,26 +490,60 @@ def find_h5_files_improved():
         './input',
         '.',
     ]
+    return [d for d in dict.fromkeys(search_dirs) if os.path.exists(d)]
+
+def _rejected_files_key(rejected):
+    """Stat of files rejected by the last scan.
+    
+    A file that is still being copied can become valid without its directory's
+    mtime changing, so these are checked on every call.
+    """
+    key = []
+    for file_path in rejected:
+        try:
+            file_stat = os.stat(file_path)
+            key.append((file_path, file_stat.st_mtime_ns, file_stat.st_size))
+        except OSError:
+            key.append((file_path, None, None))
+    return tuple(key)
+
+def find_h5_files_improved():
+    """Improved H5 file discovery with proper deduplication and filtering.
+    
+    The scan is reused while no search directory mtime (files added, removed or
+    renamed) and no previously rejected file has changed.
+    """
+    search_dirs = h5_search_dirs()
+    try:
+        dirs_key = tuple((d, os.stat(d).st_mtime_ns) for d in search_dirs)
+    except OSError:
+        dirs_key = None
     
-    search_dirs = [d for d in dict.fromkeys(search_dirs) if os.path.exists(d)]
+    if (dirs_key is not None and _H5_SCAN_CACHE.get('dirs_key') == dirs_key and
+            _H5_SCAN_CACHE['rejected_key'] == _rejected_files_key(_H5_SCAN_CACHE['rejected'])):
+        return list(_H5_SCAN_CACHE['files'])
+    
+    h5_files = []
+    rejected = []
+    seen_filenames = set()
     
     print(f"[INFO] Searching in directories: {search_dirs}")
     
     for search_dir in search_dirs:
         try:
-            pattern = os.path.join(search_dir, '*.h5')
-            found_files = glob.glob(pattern)
+            found_files = _list_h5_dir(search_dir)
             
-            for file_path in found_files:
+            for file_path, file_stat in found_files:
                 filename = os.path.basename(file_path)
                 
                 if filename in seen_filenames:
                     print(f"[INFO] Skipping duplicate: {filename}")
                     continue
                 
-                is_valid, message = validate_h5_file(file_path)
+                is_valid, message = validate_h5_file(file_path, file_stat)
                 if not is_valid:
                     print(f"[WARNING] Skipping invalid file {filename}: {message}")
+                    rejected.append(file_path)
                     continue
                 
                 seen_filenames.add(filename)
@@ -307,6 +555,12 @@ def find_h5_files_improved():
     
     h5_files.sort(key=lambda x: os.path.basename(x).lower())
     
+    _H5_PATH_INDEX.clear()
+    _H5_PATH_INDEX.update((os.path.basename(file_path), file_path) for file_path in h5_files)
+    
+    _H5_SCAN_CACHE.update(dirs_key=dirs_key, files=list(h5_files), rejected=rejected,
+                          rejected_key=_rejected_files_key(rejected))
+    
     print(f"[INFO] Total unique H5 files found: {len(h5_files)}")
     return h5_files
 
@@ -346,177 +600,363 @@ def filter_h5_files_by_pattern(h5_files, max_files=15):
     
     return filtered_files[:max_files]
 
-def get_available_coils_dynamic(file_path):
-    """Dynamically discover available coils in the H5 file."""
-    available_coils = []
+H5_DATA_TYPES = ('bending', 'screwdown', 'profile')
+
+def scan_h5_structure(file_path, h5=None):
+    """Walk the H5 file once and collect its coils and data group paths.
     
+    Returns a dict with:
+        coils: sorted coil names found in the file
+        data_paths: {coil: {data_type: group path}} for every found coil
+        any_paths: {data_type: group path} regardless of coil
+        data_groups: [(group path, data types)] for groups holding x and z
+    The result is cached on config per file path and mtime.
+    """
     try:
-        with h5py.File(file_path, 'r') as f:
-            print(f"[INFO] Searching for coils in {file_path}")
-            
-            def find_coils(name, obj):
-                if isinstance(obj, h5py.Group):
-                    path_parts = name.split('/')
-                    for part in path_parts:
-                        part_lower = part.lower()
-                        if ('coil' in part_lower and 
-                            any(char.isdigit() for char in part) and
-                            len(part) < 20):
-                            
-                            try:
-                                if ('x' in obj and 'z' in obj) or any('x' in child or 'z' in child for child in obj.keys()):
-                                    if part not in available_coils:
-                                        available_coils.append(part)
-                                        print(f"[INFO] Found valid coil: {part}")
-                            except:
-                                continue
-            
-            f.visititems(find_coils)
+        mtime_ns = os.stat(file_path).st_mtime_ns
+    except OSError as e:
+        print(f"[ERROR] Cannot stat {file_path}: {e}")
+        mtime_ns = None
+    
+    cached = config.h5_structure_cache.get(file_path)
+    if cached is not None and mtime_ns is not None and cached[0] == mtime_ns:
+        return cached[1]
+    
+    coils = []
+    numeric_coils = []
+    data_groups = []
+    any_paths = {}
+    
+    try:
+        with h5_file_context(file_path, h5) as f:
+            print(f"[INFO] Scanning structure of {file_path}")
             
-            if not available_coils:
-                print("[INFO] No coils found with standard pattern, trying alternative search...")
+            def collect_group(name, obj):
+                if not isinstance(obj, h5py.Group):
+                    return
                 
-                def find_coils_alternative(name, obj):
-                    if isinstance(obj, h5py.Group):
-                        path_parts = name.split('/')
-                        for part in path_parts:
-                            if (part.isdigit() and 
-                                int(part) >= 50 and int(part) <= 60 and
-                                ('x' in obj and 'z' in obj)):
-                                coil_name = f"coil {part}"
-                                if coil_name not in available_coils:
-                                    available_coils.append(coil_name)
-                                    print(f"[INFO] Found numeric coil: {coil_name}")
+                path_parts = name.split('/')
+                coil_parts = [part for part in path_parts
+                              if 'coil' in part.lower() and
+                              any(char.isdigit() for char in part) and
+                              len(part) < 20]
+                numeric_parts = [part for part in path_parts
+                                 if part.isdigit() and 50 <= int(part) <= 60]
+                data_types = [data_type for data_type in H5_DATA_TYPES if data_type in name.lower()]
                 
-                f.visititems(find_coils_alternative)
-        
-        def extract_number(coil_name):
-            numbers = ''.join(filter(str.isdigit, coil_name))
-            return int(numbers) if numbers else 0
-        
-        available_coils = sorted(list(set(available_coils)), key=extract_number)
-        
-        print(f"[INFO] Final available coils: {available_coils}")
-        
+                if not (coil_parts or numeric_parts or data_types):
+                    return
+                
+                try:
+                    has_xz = 'x' in obj and 'z' in obj
+                    
+                    if coil_parts and (has_xz or any('x' in child or 'z' in child for child in obj.keys())):
+                        for part in coil_parts:
+                            if part not in coils:
+                                coils.append(part)
+                                print(f"[INFO] Found valid coil: {part}")
+                    
+                    if has_xz:
+                        for part in numeric_parts:
+                            coil_name = f"coil {part}"
+                            if coil_name not in numeric_coils:
+                                numeric_coils.append(coil_name)
+                        
+                        if data_types:
+                            data_groups.append((name, data_types))
+                            for data_type in data_types:
+                                any_paths[data_type] = name
+                except Exception:
+                    return
+            
+            f.visititems(collect_group)
+    
     except Exception as e:
-        print(f"[ERROR] Error getting available coils: {e}")
-        available_coils = []
+        print(f"[ERROR] Error scanning H5 structure: {e}")
+        traceback.print_exc()
+        return {"coils": [], "data_paths": {}, "any_paths": {}, "data_groups": []}
+    
+    if not coils and numeric_coils:
+        print(f"[INFO] No coils found with standard pattern, using numeric coils: {numeric_coils}")
+        coils = numeric_coils
+    
+    coils = sorted(set(coils), key=coil_sort_key)
+    
+    structure = {
+        "coils": coils,
+        "data_paths": {},
+        "any_paths": any_paths,
+        "data_groups": data_groups
+    }
+    structure["data_paths"] = {coil: _match_coil_data_paths(structure, coil) for coil in coils}
+    
+    if mtime_ns is not None:
+        config.h5_structure_cache[file_path] = (mtime_ns, structure)
+    
+    return structure
+
+def _match_coil_data_paths(structure, coil_name):
+    """Pick the data group paths belonging to a coil from a scanned structure."""
+    data_paths = {}
+    for name, data_types in structure["data_groups"]:
+        if coil_name in name:
+            for data_type in data_types:
+                data_paths[data_type] = name
+    return data_paths
+
+def get_available_coils_dynamic(file_path, structure=None):
+    """Dynamically discover available coils in the H5 file."""
+    if structure is None:
+        structure = scan_h5_structure(file_path)
+    
+    available_coils = list(structure["coils"])
+    print(f"[INFO] Final available coils: {available_coils}")
     
     return available_coils
 
 def find_file_path(file_name):
     """Dynamically find the full path of an H5 file"""
-    all_h5_files = find_h5_files_improved()
+    file_path = _H5_PATH_INDEX.get(file_name)
     
-    for file_path in all_h5_files:
-        if os.path.basename(file_path) == file_name:
-            return file_path
+    # Rescan only when the name is unknown or the indexed file has gone away
+    if file_path is None or not os.path.exists(file_path):
+        find_h5_files_improved()
+        file_path = _H5_PATH_INDEX.get(file_name)
     
-    return None
+    return file_path
 
 def generate_reference_display(ref_x, ref_z):
+    """Interleave reference points with the midpoints between neighbouring points."""
     if ref_x is None or ref_z is None:
         return np.array([]), np.array([]), np.array([])
 
-    display_x, display_z, is_midpoint = [], [], []
+    ref_x = np.asarray(ref_x)
+    ref_z = np.asarray(ref_z)
+    n = len(ref_x)
+    if n == 0:
+        return np.array([]), np.array([]), np.array([], dtype=bool)
 
-    for i in range(len(ref_x) - 1):
-        display_x.append(ref_x[i])
-        display_z.append(ref_z[i])
-        is_midpoint.append(False)
+    display_x = np.empty(2 * n - 1, dtype=np.result_type(ref_x.dtype, np.float32))
+    display_z = np.empty(2 * n - 1, dtype=np.result_type(ref_z.dtype, np.float32))
 
-        mx = (ref_x[i] + ref_x[i+1]) / 2
-        mz = (ref_z[i] + ref_z[i+1]) / 2
-        display_x.append(mx)
-        display_z.append(mz)
-        is_midpoint.append(True)
+    # Originals on even slots, midpoints on odd slots
+    display_x[0::2] = ref_x
+    display_x[1::2] = 0.5 * (ref_x[:-1] + ref_x[1:])
+    display_z[0::2] = ref_z
+    display_z[1::2] = 0.5 * (ref_z[:-1] + ref_z[1:])
 
-    display_x.append(ref_x[-1])
-    display_z.append(ref_z[-1])
-    is_midpoint.append(False)
+    is_midpoint = np.zeros(2 * n - 1, dtype=bool)
+    is_midpoint[1::2] = True
 
-    return np.array(display_x), np.array(display_z), np.array(is_midpoint)
+    return display_x, display_z, is_midpoint
 
-def get_coil_data_paths(file_path, coil_name):
+def get_coil_data_paths(file_path, coil_name, structure=None):
     """Dynamically find data paths for a specific coil in the H5 file."""
-    data_paths = {}
+    if structure is None:
+        structure = scan_h5_structure(file_path)
     
-    try:
-        with h5py.File(file_path, 'r') as f:
-            def find_coil_data(name, obj):
-                if isinstance(obj, h5py.Group):
-                    if coil_name in name:
-                        for data_type in ['bending', 'screwdown', 'profile']:
-                            if data_type in name.lower():
-                                if 'x' in obj and 'z' in obj:
-                                    data_paths[data_type] = name
-                                    print(f"[INFO] Found {data_type} data at: {name}")
-            
-            f.visititems(find_coil_data)
-            
-    except Exception as e:
-        print(f"[ERROR] Error finding coil data paths: {e}")
-        traceback.print_exc()
+    data_paths = structure["data_paths"].get(coil_name)
+    if data_paths is None:
+        data_paths = _match_coil_data_paths(structure, coil_name)
     
-    return data_paths
+    for data_type, name in data_paths.items():
+        print(f"[INFO] Found {data_type} data at: {name}")
+    
+    return dict(data_paths)
 
 def generate_coil_blank_info(coil_name, num_rows):
     """Generate continuous blank info numbers for a specific coil"""
+    with _BLANK_INFO_LOCK:
+        return _generate_coil_blank_info(coil_name, num_rows)
+
+def _generate_coil_blank_info(coil_name, num_rows):
+    global NEXT_BLANK_INFO_START
+    
     if coil_name in COIL_BLANK_INFO_RANGES:
-        start_num = COIL_BLANK_INFO_RANGES[coil_name]["start"]
+        info = COIL_BLANK_INFO_RANGES[coil_name]
+        start_num = info["start"]
         
         # Generate exactly num_rows blank info numbers starting from start_num
-        blank_info = np.arange(start_num, start_num + num_rows)
-        print(f"[INFO] Generated blank info for {coil_name}: {start_num} to {start_num + num_rows - 1} ({num_rows} rows)")
+        if num_rows == info["count"] and "data" in info:
+            blank_info = info["data"]
+        else:
+            blank_info = np.arange(start_num, start_num + num_rows, dtype=np.int32)
+        
+        if config.debug_mode:
+            print(f"[DEBUG] Generated blank info for {coil_name}: {start_num} to {start_num + num_rows - 1} ({num_rows} rows)")
         
         return blank_info
     else:
         # Handle missing coil ranges gracefully - ensure uniqueness across sessions
-        if COIL_BLANK_INFO_RANGES:
-            max_end = max([info["end"] for info in COIL_BLANK_INFO_RANGES.values()])
-            start_num = max_end + 1
-        else:
-            start_num = 1
-        
+        start_num = NEXT_BLANK_INFO_START
         end_num = start_num + num_rows - 1
+        NEXT_BLANK_INFO_START = end_num + 1
+        
+        blank_info = np.arange(start_num, start_num + num_rows, dtype=np.int32)
         COIL_BLANK_INFO_RANGES[coil_name] = {
             "start": start_num,
             "end": end_num,
-            "count": num_rows
+            "count": num_rows,
+            "data": blank_info
         }
         
-        blank_info = np.arange(start_num, start_num + num_rows)
-        print(f"[INFO] Generated dynamic blank info for {coil_name}: {start_num} to {end_num} ({num_rows} rows)")
+        if config.debug_mode:
+            print(f"[DEBUG] Generated dynamic blank info for {coil_name}: {start_num} to {end_num} ({num_rows} rows)")
         
         return blank_info
 
-def load_data_from_h5_dynamic(file_path, selected_coil=''):
+def _memmap_h5_dataset(dataset):
+    """Map a contiguous, unfiltered dataset of a read-only file straight from disk.
+    
+    Returns None when the dataset cannot be mapped (chunked, compressed, empty,
+    external storage or a writable file).
+    """
+    if dataset.chunks is not None or dataset.compression is not None or dataset.size == 0:
+        return None
+    if dataset.file.mode != 'r':
+        return None
+    
+    try:
+        offset = dataset.id.get_offset()
+    except Exception:
+        return None
+    if offset is None:
+        return None
+    
+    mapped = np.memmap(dataset.file.filename, mode='r', dtype=dataset.dtype,
+                       offset=offset, shape=dataset.shape)
+    # Plain ndarray view so slices don't carry the memmap subclass around
+    return mapped.view(np.ndarray)
+
+def is_memory_mapped(array):
+    """True when array is backed by an np.memmap, so its rows are only paged in when accessed."""
+    base = array
+    while base is not None:
+        if isinstance(base, np.memmap):
+            return True
+        base = getattr(base, 'base', None)
+    return False
+
+def read_h5_dataset(dataset, as_rows=False):
+    """Read a whole dataset, memory-mapped when contiguous, else into a preallocated buffer."""
+    buffer = _memmap_h5_dataset(dataset)
+    if buffer is None:
+        buffer = np.empty(dataset.shape, dtype=dataset.dtype)
+        if buffer.size > 0:
+            dataset.read_direct(buffer)
+    
+    # A 1D dataset holds a single row; reshaping is a view, not a copy
+    if as_rows and buffer.ndim == 1:
+        buffer = buffer.reshape(1, -1)
+    
+    return buffer
+
+def check_row_chunking(dataset):
+    """Warn when a 2D dataset is chunked across rows instead of one row per chunk.
+    
+    The dashboard steps through data row by row; chunks spanning several rows
+    force HDF5 to decompress neighbouring rows too. Whole datasets are still read
+    into memory on load, so this is advice for how the files are written.
+    """
+    chunks = dataset.chunks
+    if chunks is None or len(dataset.shape) != 2:
+        return
+    
+    row_bytes = dataset.shape[1] * dataset.dtype.itemsize
+    if chunks[0] != 1 and row_bytes < (1 << 20):
+        print(f"[WARNING] {dataset.name} is chunked as {chunks}; "
+              f"chunks=(1, {dataset.shape[1]}) would match row-wise access")
+
+def to_display_precision(array):
+    """Cast float64 data to float32.
+    
+    Loaded arrays are only ever displayed, so float64 just doubles the memory
+    held in data_store and the size of the figures sent to the browser.
+    """
+    if array is not None and array.dtype == np.float64:
+        return array.astype(np.float32)
+    return array
+
+def format_pairs(x, z):
+    """'(x, z)' cell texts of two equally shaped arrays, truncated to integers like int()."""
+    x_text = x.astype(np.int64).astype(str)
+    z_text = z.astype(np.int64).astype(str)
+    return np.char.add(np.char.add(np.char.add('(', x_text), ', '), np.char.add(z_text, ')'))
+
+def reference_display_texts(ref_x, ref_z, is_midpoint):
+    """Table texts of the display reference points: '(x, z)', or just x on midpoints."""
+    return np.where(is_midpoint, ref_x.astype(np.int64).astype(str), format_pairs(ref_x, ref_z)).tolist()
+
+def fallback_reference(actual):
+    """Column mean of 2D actual data, used when the file carries no reference curve."""
+    if actual.shape[0] == 1:
+        return actual[0]
+    
+    reference = np.empty(actual.shape[1], dtype=np.float32)
+    np.mean(actual, axis=0, dtype=np.float32, out=reference)
+    return reference
+
+def downsample_columns(array, block):
+    """Average every `block` neighbouring columns of a 2D array, dropping the ragged tail."""
+    num_rows, num_cols = array.shape
+    usable_cols = num_cols - num_cols % block
+    return array[:, :usable_cols].reshape(num_rows, -1, block).mean(axis=-1, dtype=np.float32)
+
+def _has_rows(data):
+    """True when a loaded data type dict holds a non-empty actual_x array."""
+    return data is not None and data.get("actual_x") is not None and data["actual_x"].size > 0
+
+def count_data_rows(data):
+    """Largest actual_x row count over the screwdown, bending and profile entries of data."""
+    return max((data[key]["actual_x"].shape[0] for key in H5_DATA_TYPES if _has_rows(data.get(key))),
+               default=0)
+
+def stack_actual_rows(result):
+    """Stack the actual arrays of the combined graph types into (types, rows, points) blocks.
+    
+    Only done when they are all in memory with one shape and dtype; the per-type
+    arrays are replaced by views into the stack, so one row of every type is a
+    single slice. Returns None when the arrays cannot be stacked.
+    """
+    data_types = [group[0] for group in COMBINED_TRACE_GROUPS if _has_rows(result.get(group[0]))]
+    if len(data_types) < 2:
+        return None
+    
+    arrays = [result[t][key] for t in data_types for key in ('actual_x', 'actual_z')]
+    if any(is_memory_mapped(array) for array in arrays):
+        return None
+    if len({(array.shape, array.dtype) for array in arrays}) != 1:
+        return None
+    
+    stacked_x = np.stack([result[t]['actual_x'] for t in data_types])
+    stacked_z = np.stack([result[t]['actual_z'] for t in data_types])
+    for i, data_type in enumerate(data_types):
+        result[data_type]['actual_x'] = stacked_x[i]
+        result[data_type]['actual_z'] = stacked_z[i]
+    
+    return {"data_types": tuple(data_types), "actual_x": stacked_x, "actual_z": stacked_z}
+
+def load_data_from_h5_dynamic(file_path, selected_coil='', structure=None, h5=None):
     """Dynamically load data from H5 file without hardcoded paths."""
     result = {
         "screwdown": None,
         "bending": None,
         "profile": None,
-        "blank_info": None
+        "blank_info": None,
+        "combined_actual": None
     }
 
     try:
-        with h5py.File(file_path, 'r') as f:
+        with h5_file_context(file_path, h5) as f:
             print(f"[INFO] Loading data for coil: {selected_coil}")
             
+            if structure is None:
+                structure = scan_h5_structure(file_path, f)
+            
             if selected_coil:
-                coil_data_paths = get_coil_data_paths(file_path, selected_coil)
+                coil_data_paths = get_coil_data_paths(file_path, selected_coil, structure)
             else:
-                coil_data_paths = {}
-                
-                def find_any_data(name, obj):
-                    if isinstance(obj, h5py.Group):
-                        for data_type in ['bending', 'screwdown', 'profile']:
-                            if data_type in name.lower():
-                                if 'x' in obj and 'z' in obj:
-                                    coil_data_paths[data_type] = name
-                                    print(f"[INFO] Found {data_type} data at: {name}")
-                
-                f.visititems(find_any_data)
+                coil_data_paths = dict(structure["any_paths"])
             
             if not coil_data_paths:
                 print(f"[WARNING] No data paths found for {selected_coil}")
@@ -527,13 +967,24 @@ def load_data_from_h5_dynamic(file_path, selected_coil=''):
                 try:
                     data_group = f[data_path]
                     
-                    actual_x = data_group['x'][:]
-                    actual_z = data_group['z'][:]
+                    check_row_chunking(data_group['x'])
+                    check_row_chunking(data_group['z'])
+                    
+                    actual_x = read_h5_dataset(data_group['x'], as_rows=True)
+                    actual_z = read_h5_dataset(data_group['z'], as_rows=True)
                     
-                    if len(actual_x.shape) == 1:
-                        actual_x = actual_x.reshape(1, -1)
-                    if len(actual_z.shape) == 1:
-                        actual_z = actual_z.reshape(1, -1)
+                    # Memory-mapped data stays on disk in its file dtype and is cast to float32
+                    # per row or actual-store window when displayed (display_points,
+                    # display_rows); casting it here would read the whole dataset into memory
+                    if not is_memory_mapped(actual_x):
+                        actual_x = to_display_precision(actual_x)
+                    if not is_memory_mapped(actual_z):
+                        actual_z = to_display_precision(actual_z)
+                    
+                    block = config.downsample_block
+                    if block > 1 and actual_x.shape[1] >= 2 * block:
+                        actual_x = downsample_columns(actual_x, block)
+                        actual_z = downsample_columns(actual_z, block)
                     
                     ref_x = None
                     ref_z = None
@@ -563,20 +1014,19 @@ def load_data_from_h5_dynamic(file_path, selected_coil=''):
                             ref_z = np.array(data_group.attrs[attr_name])
                             break
                     
-                    # Try to find reference data in datasets
-                    if ref_x is None or ref_z is None:
-                        if 'ref_x' in data_group:
-                            ref_x = data_group['ref_x'][:]
-                        if 'ref_z' in data_group:
-                            ref_z = data_group['ref_z'][:]
+                    # Try to find the still missing reference data in datasets
+                    if ref_x is None and 'ref_x' in data_group:
+                        ref_x = read_h5_dataset(data_group['ref_x'])
+                    if ref_z is None and 'ref_z' in data_group:
+                        ref_z = read_h5_dataset(data_group['ref_z'])
                     
                     # If still no reference data, create fallback from actual data
                     if ref_x is None and actual_x.size > 0:
-                        ref_x = np.mean(actual_x, axis=0) if actual_x.ndim > 1 else actual_x
+                        ref_x = fallback_reference(actual_x)
                         print(f"[INFO] Generated fallback ref_x from actual_x for {data_type}")
 
                     if ref_z is None and actual_z.size > 0:
-                        ref_z = np.mean(actual_z, axis=0) if actual_z.ndim > 1 else actual_z
+                        ref_z = fallback_reference(actual_z)
                         print(f"[INFO] Generated fallback ref_z from actual_z for {data_type}")
 
                     # Validate that ref_x and ref_z have same length
@@ -585,14 +1035,19 @@ def load_data_from_h5_dynamic(file_path, selected_coil=''):
                         continue
 
                                         
-                    disp_x, disp_z, is_mid = generate_reference_display(ref_x, ref_z)
+                    disp_x, disp_z, is_mid = generate_reference_display(
+                        to_display_precision(ref_x), to_display_precision(ref_z))
                     
                     result[data_type] = {
                         "actual_x": actual_x,
                         "actual_z": actual_z,
                         "ref_x": disp_x,
                         "ref_z": disp_z,
-                        "is_midpoint": is_mid
+                        "is_midpoint": is_mid,
+                        # Table texts of the reference points, fixed until the file is reloaded
+                        "ref_display": reference_display_texts(disp_x, disp_z, is_mid),
+                        # Reference marker sizes, zero on midpoints; fixed until the file is reloaded
+                        "ref_marker_size": np.where(is_mid, 0, 6).astype(np.uint8)
                     }
                     
                     print(f"[INFO] Successfully loaded {data_type} data: {actual_x.shape[0]} rows, {actual_x.shape[1]} points")
@@ -601,16 +1056,16 @@ def load_data_from_h5_dynamic(file_path, selected_coil=''):
                     print(f"[ERROR] Error loading {data_type} data: {e}")
                     continue
             
+            result["combined_actual"] = stack_actual_rows(result)
+            
             # Generate continuous blank info for the selected coil
-            num_rows = 0
-            for key in ["screwdown", "bending", "profile"]:
-                if result[key] and "actual_x" in result[key]:
-                    num_rows = max(num_rows, result[key]["actual_x"].shape[0])
+            num_rows = count_data_rows(result)
             
             # Ensure blank_info indexing is 1-to-1 with actual_x rows
             if num_rows > 0:
                 result["blank_info"] = generate_coil_blank_info(selected_coil, num_rows)
-                print(f"[DEBUG] Blank info assigned: length={len(result['blank_info'])}, range={result['blank_info'][0] if len(result['blank_info']) > 0 else 'N/A'}-{result['blank_info'][-1] if len(result['blank_info']) > 0 else 'N/A'}")
+                if config.debug_mode:
+                    print(f"[DEBUG] Blank info assigned: length={len(result['blank_info'])}, range={result['blank_info'][0] if len(result['blank_info']) > 0 else 'N/A'}-{result['blank_info'][-1] if len(result['blank_info']) > 0 else 'N/A'}")
             else:
                 result["blank_info"] = np.array([])
 
@@ -620,6 +1075,59 @@ def load_data_from_h5_dynamic(file_path, selected_coil=''):
 
     return result
 
+def load_coil_data_cached(file_path, coil_name, structure=None, h5=None):
+    """load_data_from_h5_dynamic behind an LRU cache keyed by file mtime and coil name."""
+    mtime_ns = os.stat(file_path).st_mtime_ns
+    key = (file_path, mtime_ns, coil_name)
+    
+    while True:
+        with _COIL_CACHE_LOCK:
+            if key in _COIL_CACHE:
+                _COIL_CACHE.move_to_end(key)
+                print(f"[INFO] Using cached data for coil '{coil_name}'")
+                return _COIL_CACHE[key]
+            
+            loading = _COIL_LOADING.get(key)
+            if loading is None:
+                # The file changed on disk, drop everything loaded from its older version
+                for stale_key in [k for k in _COIL_CACHE if k[0] == file_path and k[1] != mtime_ns]:
+                    del _COIL_CACHE[stale_key]
+                loading = _COIL_LOADING[key] = threading.Event()
+                break
+        
+        # Another thread is loading this coil; wait for it, then look in the cache again
+        loading.wait()
+    
+    try:
+        dynamic_data = load_data_from_h5_dynamic(file_path, coil_name, structure, h5)
+        with _COIL_CACHE_LOCK:
+            if count_data_rows(dynamic_data) > 0:
+                _COIL_CACHE[key] = dynamic_data
+                while len(_COIL_CACHE) > config.cache_max_coils:
+                    _COIL_CACHE.popitem(last=False)
+    finally:
+        with _COIL_CACHE_LOCK:
+            del _COIL_LOADING[key]
+        loading.set()
+    
+    return dynamic_data
+
+def prefetch_coils(file_path, coils, structure):
+    """Load coils into _COIL_CACHE in the background; stops once another file is opened."""
+    file_name = os.path.basename(file_path)
+    
+    def prefetch():
+        try:
+            with open_h5_file(file_path) as h5:
+                for coil in coils:
+                    if current_file_name != file_name:
+                        return
+                    load_coil_data_cached(file_path, coil, structure, h5)
+        except Exception:
+            logger.exception("Prefetching coils of %s failed", file_name)
+    
+    _PREFETCH_POOL.submit(prefetch)
+
 def find_h5_files():
     """Find all available H5 files with proper deduplication and filtering."""
     all_h5_files = find_h5_files_improved()
@@ -638,7 +1146,7 @@ def find_h5_files():
     return unique_filenames
 
 def handle_h5_file_loading(file_path):
-    global data_store, current_file_name, config, selected_coil, available_coils, selected_row
+    global data_store, current_file_name, config, selected_coil, available_coils, selected_row, DATA_VERSION
 
     file_name = os.path.basename(file_path)
     current_file_name = file_name
@@ -646,39 +1154,46 @@ def handle_h5_file_loading(file_path):
     try:
         print(f"[INFO] Attempting to load HDF5 file: {file_path}")
         
-        file_coils = get_available_coils_dynamic(file_path)
+        # Keep one handle open for the structure scan, range calculation and data read
+        with open_h5_file(file_path) as h5:
+            structure = scan_h5_structure(file_path, h5)
+            file_coils = get_available_coils_dynamic(file_path, structure)
         
-        if file_coils:
-            available_coils = file_coils
-            print(f"[INFO] Available coils in file: {available_coils}")
+            if file_coils:
+                available_coils = file_coils
+                print(f"[INFO] Available coils in file: {available_coils}")
             
-            # Calculate dynamic ranges for all coils
-            calculate_coil_ranges(file_path, available_coils)
+                # Calculate dynamic ranges for all coils
+                calculate_coil_ranges(file_path, available_coils, structure, h5)
             
-            if selected_coil not in available_coils:
-                selected_coil = available_coils[0]
-                print(f"[INFO] Selected coil set to: {selected_coil}")
-        else:
-            print("[WARNING] No coils found in file, attempting to load data directly")
-            available_coils = []
-            selected_coil = ""
+                if selected_coil not in available_coils:
+                    selected_coil = available_coils[0]
+                    print(f"[INFO] Selected coil set to: {selected_coil}")
+            else:
+                print("[WARNING] No coils found in file, attempting to load data directly")
+                available_coils = []
+                selected_coil = ""
 
-        # Reset selected_row when coil changes
-        selected_row = 0
+            # Reset selected_row when coil changes
+            selected_row = 0
 
-        if available_coils:
-            dynamic_data = load_data_from_h5_dynamic(file_path, selected_coil)
-        else:
-            dynamic_data = load_data_from_h5_dynamic(file_path, "")
+            if available_coils:
+                dynamic_data = load_coil_data_cached(file_path, selected_coil, structure, h5)
+            else:
+                dynamic_data = load_coil_data_cached(file_path, "", structure, h5)
 
-        if dynamic_data and any(dynamic_data.values()):
-            print(f"[INFO] Successfully loaded data")
+        # The next coils are the likeliest to be picked, so they are loaded first; the cache
+        # keeps the selected coil, so at most cache_max_coils - 1 others fit next to it
+        if config.prefetch_coils and len(available_coils) > 1:
+            index = available_coils.index(selected_coil)
+            others = available_coils[index + 1:] + available_coils[:index]
+            prefetch_coils(file_path, others[:config.cache_max_coils - 1], structure)
 
-            # Get the actual number of rows from the loaded data
-            actual_num_rows = 0
-            for key in ["screwdown", "bending", "profile"]:
-                if dynamic_data.get(key) and "actual_x" in dynamic_data[key]:
-                    actual_num_rows = max(actual_num_rows, dynamic_data[key]["actual_x"].shape[0])
+        # Get the actual number of rows from the loaded data
+        actual_num_rows = count_data_rows(dynamic_data)
+
+        if actual_num_rows > 0:
+            print(f"[INFO] Successfully loaded data")
 
             # Ensure blank_info matches the actual data rows
             if dynamic_data.get("blank_info") is not None:
@@ -690,9 +1205,12 @@ def handle_h5_file_loading(file_path):
                 blank_info_data = generate_coil_blank_info(selected_coil, actual_num_rows)
 
             data_store = {
-                "screwdown": dynamic_data.get("screwdown", {}),
-                "bending": dynamic_data.get("bending", {}),
-                "profile": dynamic_data.get("profile", {}),
+                # Missing types are stored as {} (the loader leaves them None), so every
+                # entry is a dict and present arrays are always ndarrays
+                "screwdown": dynamic_data.get("screwdown") or {},
+                "bending": dynamic_data.get("bending") or {},
+                "profile": dynamic_data.get("profile") or {},
+                "combined_actual": dynamic_data.get("combined_actual"),
                 "blank_info": {
                     "label": "Blank Info",
                     "data": blank_info_data
@@ -703,7 +1221,19 @@ def handle_h5_file_loading(file_path):
                 }
             }
 
+            # Row and point counts the table reads on every render
+            shapes = [data_store[t]['actual_x'].shape for t in H5_DATA_TYPES if 'actual_x' in data_store[t]]
+            data_store["shapes"] = {
+                "max_rows_all": min((shape[0] for shape in shapes), default=0),
+                "max_points_all": max((shape[1] for shape in shapes), default=0),
+            }
+
             config.data_rows = actual_num_rows
+            DATA_VERSION += 1
+            # Figures of the previous data can never be hit again, free them now
+            _build_combined.cache_clear()
+            _build_tab_figure.cache_clear()
+            _build_table.cache_clear()
             return True
         else:
             print("[ERROR] Dynamic loading failed, no data found.")
@@ -714,13 +1244,22 @@ def handle_h5_file_loading(file_path):
         traceback.print_exc()
         return False
 
+# Gzip callback responses when flask-compress is installed; the table and graph
+# payloads are large and repetitive
+try:
+    import flask_compress  # noqa: F401
+    COMPRESS_RESPONSES = True
+except ImportError:
+    COMPRESS_RESPONSES = False
+
 # Create the Dash app
 app = dash.Dash(__name__, 
                 external_stylesheets=[
                     dbc.themes.BOOTSTRAP,
                     "https://cdn.jsdelivr.net/npm/bootstrap-icons@1.10.5/font/bootstrap-icons.css"
                 ],
-                suppress_callback_exceptions=True)
+                suppress_callback_exceptions=True,
+                compress=COMPRESS_RESPONSES)
 server = app.server
 server.secret_key = config.secret_key
 
@@ -734,14 +1273,24 @@ app.layout = html.Div([
     dcc.Location(id='url', refresh=False),
     html.Div(id='page-content'),
     html.Div(id='data-store', style={'display': 'none'}),
-    html.Div(id='page-store', children='1', style={'display': 'none'}),
-    html.Div(id='selected-row', children=None, style={'display': 'none'}),
-    html.Div(id='max-row', children='0', style={'display': 'none'}),
+    dcc.Store(id='page-store', data=1),
+    dcc.Store(id='selected-row', data=None),
+    dcc.Store(id='row-selected', data=False),
+    dcc.Store(id='max-row', data=0),
     html.Div(id='selected-coil', style={'display': 'none'}),
     html.Div(id='zoom-state', children='default', style={'display': 'none'}),
     html.Div(id='fullscreen-state', children='false', style={'display': 'none'}),
     html.Div(id='current-language', children=LANGUAGE, style={'display': 'none'}),
+    dcc.Store(id='applied-language', data=LANGUAGE),
+    dcc.Store(id='i18n-store', data=I18N_TEXTS),
+    dcc.Store(id='page-size', data=config.rows_per_page),
     html.Div(id='auto-advance-state', children='false', style={'display': 'none'}),
+    dcc.Store(id='file-list-store'),
+    dcc.Interval(
+        id='file-list-interval',
+        interval=30_000,  # rescan the data directories at most every 30 seconds
+        n_intervals=0
+    ),
     dcc.Interval(
         id='auto-advance-interval',
         interval=2000,  # 2 seconds
@@ -753,37 +1302,40 @@ app.layout = html.Div([
 ])
 
 # Define the file selection layout
-def create_file_selection_layout():
-    h5_files = find_h5_files()
+def create_file_list(h5_files):
+    """File list group linking every available H5 file to its load route."""
+    if not h5_files:
+        return html.P(T.no_files, className="text-center")
     
+    return dbc.ListGroup([
+        dbc.ListGroupItem([
+            html.Div([
+                html.I(className="bi bi-file-earmark-binary me-3", style={"fontSize": "1.5rem", "color": "#0d6efd"}),
+                html.Span(file, className="fs-5"),
+                html.I(className="bi bi-chevron-right ms-auto", style={"color": "#6c757d"})
+            ], className="d-flex align-items-center")
+        ], href=f"/load/{file}", action=True) 
+        for file in h5_files
+    ])
+
+def create_file_selection_layout(h5_files=None):
     return html.Div([
         html.Div([
-            html.H1(_('app_title'), className="text-center mb-4"),
+            html.H1(T.app_title, className="text-center mb-4"),
             
             dbc.Card([
                 dbc.CardHeader([
-                    html.H4(_('select_file'), className="mb-0")
+                    html.H4(T.select_file, className="mb-0")
                 ], className="bg-success text-white"),
                 dbc.CardBody([
-                    html.Div([
-                        dbc.ListGroup([
-                            dbc.ListGroupItem([
-                                html.Div([
-                                    html.I(className="bi bi-file-earmark-binary me-3", style={"fontSize": "1.5rem", "color": "#0d6efd"}),
-                                    html.Span(file, className="fs-5"),
-                                    html.I(className="bi bi-chevron-right ms-auto", style={"color": "#6c757d"})
-                                ], className="d-flex align-items-center")
-                            ], href=f"/load/{file}", action=True) 
-                            for file in h5_files
-                        ]) if h5_files else html.P(_('no_files'), className="text-center")
-                    ]),
+                    html.Div(create_file_list(h5_files), id='file-list-container'),
                     
                     html.Hr(),
                     
                     dbc.Form([
                         dbc.InputGroup([
-                            dbc.Input(id="file-name-input", placeholder=_('file_input_placeholder'), type="text"),
-                            dbc.Button(_('load_button'), id="load-file-button", color="primary")
+                            dbc.Input(id="file-name-input", placeholder=T.file_input_placeholder, type="text"),
+                            dbc.Button(T.load_button, id="load-file-button", color="primary")
                         ])
                     ], className="mt-3")
                 ])
@@ -796,6 +1348,15 @@ def create_visualization_layout():
     global LANGUAGE
     
     return html.Div([
+        # Data for the clientside graphs and table; actual-store holds one window of
+        # rows and is replaced when the selection leaves it (load_actual_window), and
+        # table-cells holds the values of the visible table page (load_table_page)
+        dcc.Store(id='ref-traces-store', data=create_ref_traces_store()),
+        dcc.Store(id='actual-store', data=create_actual_store(0)),
+        dcc.Store(id='actual-window', data=0),
+        dcc.Store(id='table-store', data=create_table_store()),
+        dcc.Store(id='table-cells', data=None),
+        
         # Language switcher
         html.Div([
             html.Span("Language: ", className="me-2"),
@@ -807,23 +1368,23 @@ def create_visualization_layout():
                        className="btn btn-sm " + ("btn-primary" if LANGUAGE == 'de' else "btn-outline-primary"))
         ], className="d-flex justify-content-end m-2"),
         
-        html.H1(_('visualization_title'), className="mb-4", 
+        html.H1(i18n_text('visualization_title'), className="mb-4",
                style={"backgroundColor": "#1e8449", "color": "white", "padding": "10px", "textAlign": "center"}),
-        html.Button(_('back_button'), id="back-button", className="btn btn-outline-secondary", style={"marginBottom": "20px", "marginLeft": "10px"}),
+        html.Button(i18n_text('back_button'), id="back-button", className="btn btn-outline-secondary", style={"marginBottom": "20px", "marginLeft": "10px"}),
         
         html.Div(id='file-info', className="mb-3 alert alert-info py-2", style={"margin": "0 10px"}),
         
         html.Div(id='coil-selection-container', className="mb-3", style={"margin": "0 10px"}),
         
         dcc.Tabs(id='tabs', value='screwdown', children=[
-            dcc.Tab(label=_('tab_screwdown'), value='screwdown'),
-            dcc.Tab(label=_('tab_bending'), value='bending'),
-            dcc.Tab(label=_('tab_profile'), value='profile'),
-            dcc.Tab(label=_('tab_all_data'), value='all_data'),
+            dcc.Tab(label=T.tab_screwdown, value='screwdown', id='tab-screwdown'),
+            dcc.Tab(label=T.tab_bending, value='bending', id='tab-bending'),
+            dcc.Tab(label=T.tab_profile, value='profile', id='tab-profile'),
+            dcc.Tab(label=T.tab_all_data, value='all_data', id='tab-all-data'),
         ]),
         
         html.Div([
-            html.Div(_('scroll_hint'), 
+            html.Div(i18n_text('scroll_hint'),
                     className="alert alert-info py-2", style={"margin": "10px 0"}),
             
             html.Div(id='table-container', style={"overflowX": "auto", "width": "100%"}),
@@ -836,7 +1397,7 @@ def create_visualization_layout():
                     
                     # Row navigation buttons
                     html.Button(
-                        _('previous_button'),
+                        i18n_text('previous_button'),
                         id="jump-previous-button",
                         n_clicks=0,
                         className="btn btn-outline-primary",
@@ -849,7 +1410,7 @@ def create_visualization_layout():
                         }
                     ),
                     html.Div([
-                        html.Label(_('jump_to_row'), className="me-2", style={"fontWeight": "bold", "fontSize": "16px"}),
+                        html.Label(i18n_text('jump_to_row'), className="me-2", style={"fontWeight": "bold", "fontSize": "16px"}),
                         dcc.Input(
                             id="jump-to-row-input",
                             type="number",
@@ -865,7 +1426,7 @@ def create_visualization_layout():
                             }
                         ),
                         html.Button(
-                            _('go_button'),
+                            i18n_text('go_button'),
                             id="jump-to-row-button",
                             n_clicks=0,
                             className="btn btn-primary",
@@ -878,7 +1439,7 @@ def create_visualization_layout():
                         )
                     ], className="d-flex align-items-center", style={"margin": "0 15px"}),
                     html.Button(
-                        _('next_button'),
+                        i18n_text('next_button'),
                         id="jump-next-button",
                         n_clicks=0,
                         className="btn btn-outline-primary",
@@ -902,11 +1463,11 @@ def create_visualization_layout():
             
             # FIXED: Ensure pagination controls always exist
             html.Div([
-                html.Button(_('previous_button'), id="prev-button", 
+                html.Button(i18n_text('previous_button', 1), id="prev-button",
                           className="btn btn-outline-primary me-2",
                           disabled=True),
-                html.Span(f"{_('page')} 1", id="page-display", className="mx-2"),
-                html.Button(_('next_button'), id="next-button", 
+                html.Span(f"{T.page} 1", id="page-display", className="mx-2"),
+                html.Button(i18n_text('next_button', 1), id="next-button",
                           className="btn btn-outline-primary ms-2")
             ], id='pagination-controls', className="d-flex justify-content-center mb-4"),
         ], className="mb-4"),
@@ -916,7 +1477,7 @@ def create_visualization_layout():
             html.Div([
                 html.Div([
                     dbc.Checklist(
-                        options=[{"label": _('auto_advance'), "value": "auto_advance"}],
+                        options=[{"label": T.auto_advance, "value": "auto_advance"}],
                         value=[],
                         id="auto-advance-checkbox",
                         className="me-3",
@@ -929,36 +1490,31 @@ def create_visualization_layout():
                         style={"fontSize": "14px", "color": "#666", "fontWeight": "bold"}
                     )
                 ], className="d-flex align-items-center me-3"),
-                html.Button(
+                i18n_title('fullscreen_mode', html.Button(
                     html.I(className="bi bi-fullscreen", style={"fontSize": "1.2rem"}),
                     id="fullscreen-button",
-                    className="btn btn-outline-primary me-2",
-                    title=_('fullscreen_mode')
-                ),
-                html.Button(
+                    className="btn btn-outline-primary me-2"
+                )),
+                i18n_title('auto_scale', html.Button(
                     html.I(className="bi bi-arrows-fullscreen", style={"fontSize": "1.2rem"}),
                     id="auto-scale-button",
-                    className="btn btn-outline-primary me-2",
-                    title=_('auto_scale')
-                ),
-                html.Button(
+                    className="btn btn-outline-primary me-2"
+                )),
+                i18n_title('zoom_in', html.Button(
                     html.I(className="bi bi-zoom-in", style={"fontSize": "1.2rem"}),
                     id="zoom-in-button",
-                    className="btn btn-outline-primary me-2",
-                    title=_('zoom_in')
-                ),
-                html.Button(
+                    className="btn btn-outline-primary me-2"
+                )),
+                i18n_title('zoom_out', html.Button(
                     html.I(className="bi bi-zoom-out", style={"fontSize": "1.2rem"}),
                     id="zoom-out-button",
-                    className="btn btn-outline-primary me-2",
-                    title=_('zoom_out')
-                ),
-                html.Button(
+                    className="btn btn-outline-primary me-2"
+                )),
+                i18n_title('reset_zoom', html.Button(
                     html.I(className="bi bi-arrow-counterclockwise", style={"fontSize": "1.2rem"}),
                     id="reset-zoom-button",
-                    className="btn btn-outline-primary",
-                    title=_('reset_zoom')
-                ),
+                    className="btn btn-outline-primary"
+                )),
             ], className="d-flex justify-content-end align-items-center mb-2", style={"margin": "0 10px"}),
         ], id='zoom-controls', style={"display": "none"}),
 
@@ -971,528 +1527,356 @@ def create_error_layout(message):
             html.Div([
                 html.I(className="bi bi-exclamation-triangle-fill", 
                       style={"color": "#f39c12", "fontSize": "64px", "marginBottom": "20px"}),
-                html.H1(_('error_title'), className="mb-4"),
+                html.H1(T.error_title, className="mb-4"),
                 html.P(message, className="lead mb-4"),
-                html.A(_('back_to_home'), href="/", className="btn btn-primary")
+                html.A(T.back_to_home, href="/", className="btn btn-primary")
             ], className="text-center py-5")
         ], className="container")
     ])
 
-# Helper function to create the combined graph
-def create_combined_graph(selected_row, zoom_state='default', is_fullscreen=False):
-    """Create a single Plotly figure for all data types with dual y-axis"""
-    try:
-        fig = go.Figure()
-        selected_row = int(selected_row) if isinstance(selected_row, (int, str)) else 0
-        
-        # Add Screwdown data (blue lines)
-        sd_data = data_store.get('screwdown', {})
-        if all(k in sd_data for k in ['actual_x', 'actual_z', 'ref_x', 'ref_z']):
-            if len(sd_data['ref_x']) > 0 and len(sd_data['ref_z']) > 0:
-                # Separate regular points and midpoints
-                is_midpoint = sd_data.get('is_midpoint', [False] * len(sd_data['ref_x']))
-                
-                # Create arrays for regular points only (for visible line)
-                regular_x = []
-                regular_z = []
-                
-                # Create arrays for all points (for hover)
-                all_x = sd_data['ref_x']
-                all_z = sd_data['ref_z']
-                
-                for i, is_mid in enumerate(is_midpoint):
-                    if not is_mid:  # Only regular points for visible line
-                        regular_x.append(sd_data['ref_x'][i])
-                        regular_z.append(sd_data['ref_z'][i])
-                
-                # Add visible line with only regular points
-                fig.add_trace(go.Scatter(
-                    x=regular_x,
-                    y=regular_z,
-                    mode='lines+markers',
-                    name='Sollprofil',
-                    line=dict(color=SCREWDOWN_REF_COLOR, width=2),
-                    marker=dict(size=6)
-                ))
-                
-                # Add invisible hover trace for all points (including midpoints)
-                fig.add_trace(go.Scatter(
-                    x=all_x,
-                    y=all_z,
-                    mode='markers',
-                    name='Sollprofil (Hover)',
-                    marker=dict(size=8, opacity=0),  # Invisible markers
-                    hovertemplate='<b>Sollprofil</b><br>X: %{x:.1f}<br>Z: %{y:.1f}<extra></extra>',
-                    showlegend=False
-                ))
-            
-            if ('actual_x' in sd_data and 'actual_z' in sd_data and 
-                sd_data['actual_x'].shape[0] > 0 and 
-                selected_row >= 0 and selected_row < sd_data['actual_x'].shape[0]):
-                
-                row_data_x = sd_data['actual_x'][selected_row]
-                row_data_z = sd_data['actual_z'][selected_row]
-                
-                fig.add_trace(go.Scatter(
-                    x=row_data_x,
-                    y=row_data_z,
-                    mode='lines',
-                    name='Istprofil',
-                    line=dict(color=SCREWDOWN_ACTUAL_COLOR, width=2)
-                ))
-        
-        # Add Profile data (green lines)
-        pd_data = data_store.get('profile', {})
-        if all(k in pd_data for k in ['actual_x', 'actual_z', 'ref_x', 'ref_z']):
-            if len(pd_data['ref_x']) > 0 and len(pd_data['ref_z']) > 0:
-                # Separate regular points and midpoints
-                is_midpoint = pd_data.get('is_midpoint', [False] * len(pd_data['ref_x']))
-                
-                # Create arrays for regular points only (for visible line)
-                regular_x = []
-                regular_z = []
-                
-                # Create arrays for all points (for hover)
-                all_x = pd_data['ref_x']
-                all_z = pd_data['ref_z']
-                
-                for i, is_mid in enumerate(is_midpoint):
-                    if not is_mid:  # Only regular points for visible line
-                        regular_x.append(pd_data['ref_x'][i])
-                        regular_z.append(pd_data['ref_z'][i])
-                
-                # Add visible line with only regular points
-                fig.add_trace(go.Scatter(
-                    x=regular_x,
-                    y=regular_z,
-                    mode='lines+markers',
-                    name='Sollanstellung',
-                    line=dict(color=PROFILE_REF_COLOR, width=2),
-                    marker=dict(size=6)
-                ))
-                
-                # Add invisible hover trace for all points (including midpoints)
-                fig.add_trace(go.Scatter(
-                    x=all_x,
-                    y=all_z,
-                    mode='markers',
-                    name='Sollanstellung (Hover)',
-                    marker=dict(size=8, opacity=0),  # Invisible markers
-                    hovertemplate='<b>Sollanstellung</b><br>X: %{x:.1f}<br>Z: %{y:.1f}<extra></extra>',
-                    showlegend=False
-                ))
-            
-            if ('actual_x' in pd_data and 'actual_z' in pd_data and 
-                pd_data['actual_x'].shape[0] > 0 and 
-                selected_row >= 0 and selected_row < pd_data['actual_x'].shape[0]):
-                
-                row_data_x = pd_data['actual_x'][selected_row]
-                row_data_z = pd_data['actual_z'][selected_row]
-                
-                fig.add_trace(go.Scatter(
-                    x=row_data_x,
-                    y=row_data_z,
-                    mode='lines',
-                    name='Istanstellung',
-                    line=dict(color=PROFILE_ACTUAL_COLOR, width=2)
-                ))
-        
-        # Add Bending data (red lines) - use secondary y-axis
-        bd_data = data_store.get('bending', {})
-        if all(k in bd_data for k in ['actual_x', 'actual_z', 'ref_x', 'ref_z']):
-            if len(bd_data['ref_x']) > 0 and len(bd_data['ref_z']) > 0:
-                # Separate regular points and midpoints
-                is_midpoint = bd_data.get('is_midpoint', [False] * len(bd_data['ref_x']))
-                
-                # Create arrays for regular points only (for visible line)
-                regular_x = []
-                regular_z = []
-                
-                # Create arrays for all points (for hover)
-                all_x = bd_data['ref_x']
-                all_z = bd_data['ref_z']
-                
-                for i, is_mid in enumerate(is_midpoint):
-                    if not is_mid:  # Only regular points for visible line
-                        regular_x.append(bd_data['ref_x'][i])
-                        regular_z.append(bd_data['ref_z'][i])
-                
-                # Add visible line with only regular points
-                fig.add_trace(go.Scatter(
-                    x=regular_x,
-                    y=regular_z,
-                    mode='lines+markers',
-                    name='Sollbiegung',
-                    line=dict(color=BENDING_REF_COLOR, width=2),
-                    marker=dict(size=6),
-                    yaxis="y2"
-                ))
-                
-                # Add invisible hover trace for all points (including midpoints)
-                fig.add_trace(go.Scatter(
-                    x=all_x,
-                    y=all_z,
-                    mode='markers',
-                    name='Sollbiegung (Hover)',
-                    marker=dict(size=8, opacity=0),  # Invisible markers
-                    hovertemplate='<b>Sollbiegung</b><br>X: %{x:.1f}<br>Z: %{y:.1f}<extra></extra>',
-                    showlegend=False,
-                    yaxis="y2"
-                ))
-            
-            if ('actual_x' in bd_data and 'actual_z' in bd_data and 
-                bd_data['actual_x'].shape[0] > 0 and 
-                selected_row >= 0 and selected_row < bd_data['actual_x'].shape[0]):
-                
-                row_data_x = bd_data['actual_x'][selected_row]
-                row_data_z = bd_data['actual_z'][selected_row]
-                
-                fig.add_trace(go.Scatter(
-                    x=row_data_x,
-                    y=row_data_z,
-                    mode='lines',
-                    name='Istbiegung',
-                    line=dict(color=BENDING_ACTUAL_COLOR, width=2),
-                    yaxis="y2"
-                ))
-        
-        # Set axis ranges based on zoom state
-        xaxis_config = dict(
-            title=_('position_label'),
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='lightgray'
-        )
-        
-        yaxis_config = dict(
-            title=_('thickness_label'),
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='lightgray'
-        )
-        
-        yaxis2_config = dict(
-            title=_('bending_label'),
-            overlaying="y",
-            side="right"
-        )
+def reference_trace(data, name, color, yaxis="y"):
+    """Reference line through all points; midpoints get zero-size markers so they only add hover."""
+    marker_size = data.get('ref_marker_size')
+    if marker_size is None:
+        is_midpoint = data.get('is_midpoint', np.zeros(len(data['ref_x']), dtype=bool))
+        marker_size = np.where(is_midpoint, 0, 6).astype(np.uint8)
+    
+    return dict(
+        type='scattergl',
+        x=data['ref_x'],
+        y=data['ref_z'],
+        mode='lines+markers',
+        name=name,
+        yaxis=yaxis,
+        line=dict(color=color, width=2),
+        marker=dict(size=marker_size),
+        hovertemplate=f'<b>{name}</b><br>X: %{{x:.1f}}<br>Z: %{{y:.1f}}<extra></extra>'
+    )
+
+def lttb_downsample(x, y, n_out):
+    """Reduce a line to n_out points with Largest-Triangle-Three-Buckets, keeping its visual shape.
+    
+    Each bucket's triangle uses the means of its neighbouring buckets as the other two
+    corners, so all buckets are independent and are reduced in one 2-D numpy pass.
+    """
+    n = len(x)
+    if n_out < 3 or n <= n_out:
+        return x, y
+    
+    x = np.asarray(x)
+    y = np.asarray(y)
+    
+    # n_out - 2 buckets over the inner points; the first and last points are always kept
+    buckets = n_out - 2
+    edges = np.linspace(1, n - 1, buckets + 1).astype(np.int64)
+    widths = np.diff(edges)
+    
+    # Bucket means from running sums
+    sum_x = np.concatenate(([0.0], np.cumsum(x, dtype=np.float64)))
+    sum_y = np.concatenate(([0.0], np.cumsum(y, dtype=np.float64)))
+    mean_x = (sum_x[edges[1:]] - sum_x[edges[:-1]]) / widths
+    mean_y = (sum_y[edges[1:]] - sum_y[edges[:-1]]) / widths
+    
+    # Triangle corners either side of each bucket; the end points close the first and last one
+    prev_x = np.concatenate(([x[0]], mean_x[:-1]))
+    prev_y = np.concatenate(([y[0]], mean_y[:-1]))
+    next_x = np.concatenate((mean_x[1:], [x[-1]]))
+    next_y = np.concatenate((mean_y[1:], [y[-1]]))
+    
+    # Buckets padded to the widest one; padding repeats the bucket's first point
+    offsets = np.arange(widths.max())
+    index = edges[:-1, None] + offsets
+    index = np.where(offsets < widths[:, None], index, edges[:-1, None])
+    
+    area = np.abs((prev_x - next_x)[:, None] * (y[index] - prev_y[:, None]) -
+                  (prev_x[:, None] - x[index]) * (next_y - prev_y)[:, None])
+    
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0] = 0
+    keep[-1] = n - 1
+    keep[1:-1] = index[np.arange(buckets), area.argmax(axis=1)]
+    
+    return x[keep], y[keep]
+
+def display_points(row_x, row_z):
+    """One row's x/z in display precision, reduced to config.max_trace_points for plotting."""
+    return lttb_downsample(to_display_precision(row_x), to_display_precision(row_z),
+                           config.max_trace_points)
+
+def display_row(data, row):
+    """Actual x/z of one row of a data type, ready for plotting."""
+    return display_points(data['actual_x'][row], data['actual_z'][row])
+
+def display_rows(data, start=0, stop=None):
+    """Plot-ready x and z lists of the rows start:stop of a data type, as display_row gives them."""
+    # Memory-mapped data is still float64 on disk; cast the window once, not row by row
+    block_x = to_display_precision(data['actual_x'][start:stop])
+    block_z = to_display_precision(data['actual_z'][start:stop])
+    points = [display_points(row_x, row_z) for row_x, row_z in zip(block_x, block_z)]
+    return [x for x, _z in points], [z for _x, z in points]
+
+def is_reduced(data):
+    """True when the rows of a data type are longer than config.max_trace_points, so LTTB reduces them."""
+    return 0 < config.max_trace_points < data['actual_x'].shape[1]
+
+def actual_trace_mode(reduced):
+    """Mode of an individual actual trace: markers only where every sample is drawn.
+    
+    Thousands of markers on a reduced preview cost more GPU time than the line
+    itself and do not mark real samples, so dense rows are plain lines.
+    """
+    return 'lines' if reduced else 'lines+markers'
+
+def relayout_x_range(relayout_data):
+    """(x0, x1) after a zoom or pan on the x axis, 'autorange' after a reset, else None."""
+    if not relayout_data:
+        return None
+    if relayout_data.get('xaxis.autorange'):
+        return 'autorange'
+    if 'xaxis.range[0]' in relayout_data and 'xaxis.range[1]' in relayout_data:
+        return float(relayout_data['xaxis.range[0]']), float(relayout_data['xaxis.range[1]'])
+    if 'xaxis.range' in relayout_data:
+        x0, x1 = relayout_data['xaxis.range']
+        return float(x0), float(x1)
+    return None
+
+def visible_points(row_x, row_z, x_range):
+    """Plot-ready points of one row within x_range, at full resolution unless still over the budget."""
+    if x_range == 'autorange':
+        return display_points(row_x, row_z)
+    
+    row_x = to_display_precision(np.asarray(row_x))
+    row_z = to_display_precision(np.asarray(row_z))
+    x0, x1 = sorted(x_range)
+    inside = (row_x >= x0) & (row_x <= x1)
+    # Keep the neighbours just outside the range, so the line runs on to the plot edges
+    keep = inside.copy()
+    keep[:-1] |= inside[1:]
+    keep[1:] |= inside[:-1]
+    return lttb_downsample(row_x[keep], row_z[keep], config.max_trace_points)
+
+def trace_bounds(traces):
+    """(x_min, x_max, y_min, y_max) over all trace points, or None when the traces are empty."""
+    xs = [np.asarray(trace['x']) for trace in traces if len(trace['x'])]
+    ys = [np.asarray(trace['y']) for trace in traces if len(trace['y'])]
+    if not xs or not ys:
+        return None
+    
+    return (float(min(x.min() for x in xs)), float(max(x.max() for x in xs)),
+            float(min(y.min() for y in ys)), float(max(y.max() for y in ys)))
+
+def tab_zoom_ranges(traces, zoom_state):
+    """(x_range, y_range) of an individual graph for the zoom_in/zoom_out presets, else None."""
+    if zoom_state not in ('zoom_in', 'zoom_out'):
+        return None
+    
+    bounds = trace_bounds(traces)
+    if bounds is None:
+        return None
+    
+    # Half-width of the visible window relative to the data span
+    factor = 0.375 if zoom_state == 'zoom_in' else 0.625
+    x_min, x_max, y_min, y_max = bounds
+    
+    x_range = x_max - x_min
+    y_range = y_max - y_min
+    
+    x_center = (x_min + x_max) / 2
+    y_center = (y_min + y_max) / 2
+    
+    return ([x_center - x_range * factor, x_center + x_range * factor],
+            [y_center - y_range * factor, y_center + y_range * factor])
+
+def combined_graph_layout(zoom_state='default', is_fullscreen=False):
+    """Layout of the combined graph; zoom presets without fixed ranges leave the axes untouched."""
+    xaxis_config = {**AXIS_GRID, 'title': T.position_label}
+    yaxis_config = {**AXIS_GRID, 'title': T.thickness_label}
+    yaxis2_config = {**AXIS_Y2, 'title': T.bending_label}
+    
+    # Apply zoom state
+    if zoom_state == 'auto':
+        xaxis_config['autorange'] = True
+        yaxis_config['autorange'] = True
+        yaxis2_config['autorange'] = True
+    elif zoom_state in COMBINED_ZOOM_RANGES:
+        ranges = COMBINED_ZOOM_RANGES[zoom_state]
+        xaxis_config['range'] = ranges['xaxis']
+        yaxis_config['range'] = ranges['yaxis']
+        yaxis2_config['range'] = ranges['yaxis2']
+    
+    return dict(
+        xaxis=xaxis_config,
+        yaxis=yaxis_config,
+        yaxis2=yaxis2_config,
+        legend=dict(
+            orientation="h", 
+            y=1.1,
+            x=0.5,
+            xanchor="center",
+            font=dict(size=12 if is_fullscreen else 10),
+            bgcolor="rgba(255,255,255,0.8)"
+        ),
+        margin=dict(l=50, r=50, t=50, b=50),
+        # Proper fullscreen height
+        height=700 if is_fullscreen else 400,
+        # Same revision across row changes lets Plotly diff the traces and keep
+        # the user's pan/zoom; a new file, tab or zoom preset resets it
+        uirevision=f"{current_file_name}:all_data:{zoom_state}",
+        hovermode="closest",
+        plot_bgcolor="white",
+        paper_bgcolor="white",
+        font=dict(size=12 if is_fullscreen else 10)
+    )
+
+def create_ref_traces_store():
+    """Static reference traces, layout and titles backing the clientside graph updates."""
+    groups = []
+    
+    for data_type, ref_name, actual_name, ref_color, actual_color, yaxis in COMBINED_TRACE_GROUPS:
+        data = data_store.get(data_type, {})
+        if not all(k in data for k in ['actual_x', 'actual_z', 'ref_x', 'ref_z']):
+            continue
         
-        # Apply zoom state
-        if zoom_state == 'auto':
-            xaxis_config['autorange'] = True
-            yaxis_config['autorange'] = True
-            yaxis2_config['autorange'] = True
-        elif zoom_state == 'default':
-            xaxis_config['range'] = [0, 1500]
-            yaxis_config['range'] = [-1000, 2000]
-            yaxis2_config['range'] = [-600, 600]
-        elif zoom_state == 'zoom_in':
-            xaxis_config['range'] = [200, 1300]
-            yaxis_config['range'] = [-750, 1750]
-            yaxis2_config['range'] = [-450, 450]
-        elif zoom_state == 'zoom_out':
-            xaxis_config['range'] = [-200, 1700]
-            yaxis_config['range'] = [-1250, 2250]
-            yaxis2_config['range'] = [-750, 750]
+        ref_traces = []
+        if len(data['ref_x']) > 0 and len(data['ref_z']) > 0:
+            ref_traces = [reference_trace(data, ref_name, ref_color, yaxis)]
         
-        # Proper fullscreen height
-        height = 700 if is_fullscreen else 400
+        groups.append({
+            "data_type": data_type,
+            "ref_traces": ref_traces,
+            "actual_trace": dict(type='scattergl', mode='lines', name=actual_name, yaxis=yaxis,
+                                 line=dict(color=actual_color, width=2)),
+        })
+    
+    return {
+        "groups": groups,
+        "layout": combined_graph_layout(None),
+        "zoom_ranges": COMBINED_ZOOM_RANGES,
+        "file_name": current_file_name,
+        "title": T.all_data_graph_title,
+        "tab_titles": {tab: series[4] for tab, series in TAB_SERIES.items()},
+    }
+
+def blank_info_range():
+    """First blank info number and row count; generate_coil_blank_info always numbers rows consecutively."""
+    blank_info = data_store.get('blank_info', {}).get('data', [])
+    return {"first": int(blank_info[0]) if len(blank_info) else 1, "count": len(blank_info)}
+
+def create_actual_store(start):
+    """Plot-ready actual rows start:start + config.store_window_rows of every graph type.
+    
+    Only this window is read, so memory-mapped data stays on disk apart from its rows.
+    """
+    stop = start + config.store_window_rows
+    actual = {}
+    
+    for data_type, *_trace_settings in COMBINED_TRACE_GROUPS:
+        data = data_store.get(data_type, {})
+        if not all(k in data for k in ['actual_x', 'actual_z', 'ref_x', 'ref_z']):
+            continue
         
-        fig.update_layout(
-            xaxis=xaxis_config,
-            yaxis=yaxis_config,
-            yaxis2=yaxis2_config,
-            legend=dict(
-                orientation="h", 
-                y=1.1,
-                x=0.5,
-                xanchor="center",
-                font=dict(size=12 if is_fullscreen else 10),
-                bgcolor="rgba(255,255,255,0.8)"
-            ),
-            margin=dict(l=50, r=50, t=50, b=50),
-            height=height,
-            hovermode="closest",
-            plot_bgcolor="white",
-            paper_bgcolor="white",
-            font=dict(size=12 if is_fullscreen else 10)
-        )
+        # Reduced like the server-rendered traces, so row changes plot the same points
+        row_x, row_z = display_rows(data, start, stop)
+        actual[data_type] = {"x": row_x, "z": row_z, "mode": actual_trace_mode(is_reduced(data))}
+    
+    return {
+        "start": start,
+        "window_rows": config.store_window_rows,
+        "actual": actual,
+        "blank_info": blank_info_range(),
+    }
+
+def combined_actual_traces(selected_row):
+    """(trace index, data type) of the actual traces in the combined graph of a row, in drawing order."""
+    traces = []
+    index = 0
+    for data_type, *_trace_settings in COMBINED_TRACE_GROUPS:
+        data = data_store.get(data_type, {})
+        if not all(k in data for k in ['actual_x', 'actual_z', 'ref_x', 'ref_z']):
+            continue
+        if len(data['ref_x']) > 0 and len(data['ref_z']) > 0:
+            index += 1
+        if 0 <= selected_row < data['actual_x'].shape[0]:
+            traces.append((index, data_type))
+            index += 1
+    return traces
+
+# Helper function to create the combined graph
+def create_combined_graph(selected_row, zoom_state='default', is_fullscreen=False):
+    """Create a single Plotly figure for all data types with dual y-axis"""
+    return _build_combined(selected_row, zoom_state, is_fullscreen, LANGUAGE, DATA_VERSION)
+
+@functools.lru_cache(maxsize=256)
+def _build_combined(selected_row, zoom_state, is_fullscreen, language, data_version):
+    """Combined figure dict for one row; language and data_version only key the cache."""
+    traces = []
+    
+    # Read the row of every stacked type with one slice
+    stacked_rows = {}
+    stacked = data_store.get('combined_actual')
+    if stacked is not None and 0 <= selected_row < stacked['actual_x'].shape[1]:
+        block_x = stacked['actual_x'][:, selected_row]
+        block_z = stacked['actual_z'][:, selected_row]
+        stacked_rows = {data_type: (block_x[i], block_z[i])
+                        for i, data_type in enumerate(stacked['data_types'])}
+    
+    for data_type, ref_name, actual_name, ref_color, actual_color, yaxis in COMBINED_TRACE_GROUPS:
+        data = data_store.get(data_type, {})
+        if not all(k in data for k in ['actual_x', 'actual_z', 'ref_x', 'ref_z']):
+            continue
         
-        return fig
-    except Exception as e:
-        print(f"[ERROR] Error creating combined graph: {str(e)}")
-        print(traceback.format_exc())
+        if len(data['ref_x']) > 0 and len(data['ref_z']) > 0:
+            # One line through all points; midpoints only show up on hover
+            traces.append(reference_trace(data, ref_name, ref_color, yaxis))
         
-        error_fig = go.Figure()
-        error_fig.add_annotation(
-            text=f"Error creating graph: {str(e)}",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5,
-            showarrow=False,
-            font=dict(size=14, color="red")
-        )
-        error_fig.update_layout(
-            title="Graph Error",
-            height=400
-        )
-        return error_fig
+        if data_type in stacked_rows or 0 <= selected_row < data['actual_x'].shape[0]:
+            if data_type in stacked_rows:
+                row_x, row_z = display_points(*stacked_rows[data_type])
+            else:
+                row_x, row_z = display_row(data, selected_row)
+            traces.append(dict(
+                type='scattergl',
+                x=row_x,
+                y=row_z,
+                mode='lines',
+                name=actual_name,
+                yaxis=yaxis,
+                line=dict(color=actual_color, width=2)
+            ))
+    
+    # A plain figure dict skips Plotly's per-trace validation; dcc.Graph takes it as is
+    return dict(data=traces, layout=combined_graph_layout(zoom_state, is_fullscreen))
 
 def create_graph_section(tab, selected_row, zoom_state='default', is_fullscreen=False):
     """Create a single Plotly figure for all data types with dual y-axis"""
-    try:
-        print(f"[DEBUG] Creating graph for tab={tab}, row={selected_row}, zoom_state={zoom_state}, fullscreen={is_fullscreen}")
-        if not data_store:
-            return html.Div("⚠️ No data for graph", className="alert alert-warning")
-        
-        # Ensure selected_row is an integer
-        try:
-            selected_row = int(selected_row)
-        except (ValueError, TypeError):
-            print(f"[ERROR] Invalid selected_row in create_graph_section: {selected_row}")
-            selected_row = 0
+    logger.debug("Creating graph for tab=%s, row=%s, zoom_state=%s, fullscreen=%s",
+                 tab, selected_row, zoom_state, is_fullscreen)
+    if not data_store:
+        return html.Div("⚠️ No data for graph", className="alert alert-warning")
+    
+    # Get the actual blank info number for display
+    blank_info_data = data_store.get('blank_info', {}).get('data', [])
+    if isinstance(blank_info_data, np.ndarray) and len(blank_info_data) > selected_row >= 0:
+        actual_blank_info = blank_info_data[selected_row]
+    else:
+        actual_blank_info = selected_row + 1
+    
+    logger.debug("Using row %s (blank info %s) for graph", selected_row, actual_blank_info)
+    
+    # For all_data tab, show a combined graph with all three data types
+    if tab == 'all_data':
+        if not all(k in data_store for k in ['screwdown', 'bending', 'profile']):
+            return html.Div("⚠️ Missing data for combined graph", className="alert alert-warning")
         
-        # Get the actual blank info number for display
-        blank_info_data = data_store.get('blank_info', {}).get('data', [])
-        if isinstance(blank_info_data, np.ndarray) and len(blank_info_data) > selected_row >= 0:
-            actual_blank_info = blank_info_data[selected_row]
-        else:
-            actual_blank_info = selected_row + 1
-        
-        print(f"[DEBUG] Using row {selected_row} (blank info {actual_blank_info}) for graph")
-        
-        # For all_data tab, show a combined graph with all three data types
-        if tab == 'all_data':
-            if not all(k in data_store for k in ['screwdown', 'bending', 'profile']):
-                return html.Div("⚠️ Missing data for combined graph", className="alert alert-warning")
-            
-            graph_panel = html.Div([
-                html.Div([
-                    html.H5(_('all_data_graph_title', actual_blank_info), className="m-0")
-                ], className="d-flex justify-content-between align-items-center px-3 py-2", 
-                   style={"backgroundColor": "#0275d8", "color": "white", "borderTopLeftRadius": "4px", "borderTopRightRadius": "4px"}),
-                
-                dcc.Graph(
-                    id='combined-graph',
-                    figure=create_combined_graph(selected_row, zoom_state, is_fullscreen),
-                    config={
-                        'displayModeBar': True,
-                        'modeBarButtonsToAdd': ['autoScale2d', 'resetScale2d', 'zoomIn2d', 'zoomOut2d'],
-                        'modeBarButtonsToRemove': ['lasso2d', 'select2d'],
-                        'displaylogo': False
-                    },
-                    style={"height": "700px" if is_fullscreen else "400px", "padding": "10px", "backgroundColor": "white"}
-                )
-            ], style={
-                "border": "1px solid #ccc",
-                "borderRadius": "4px",
-                "overflow": "hidden",
-                "marginTop": "20px",
-                "marginBottom": "20px",
-                "boxShadow": "0 2px 4px rgba(0,0,0,0.1)",
-                "maxWidth": "100%",
-                "width": "100%"
-            })
-            
-            return graph_panel
-            
-        # For individual tabs, show a single graph
-        if tab not in data_store:
-            return html.Div(f"⚠️ No data for {tab} graph", className="alert alert-warning")
-
-        data = data_store[tab]
-
-        if not all(k in data for k in ['actual_x', 'actual_z', 'ref_x', 'ref_z']):
-            return html.Div(f"⚠️ Missing data keys for {tab} graph", className="alert alert-warning")
-
-        if (len(data['ref_x'])== 0 or len(data['ref_z']) == 0 or 
-            data['actual_x'].size == 0 or data['actual_z'].size == 0):
-            return html.Div(f"⚠️ Empty data arrays for {tab} graph", className="alert alert-warning")
-
-        fig = go.Figure()
-
-        # Set colors and names based on tab
-        ref_color = SCREWDOWN_REF_COLOR
-        actual_color = SCREWDOWN_ACTUAL_COLOR
-        ref_name = "Sollprofil"
-        actual_name = "Istprofil"
-        tab_title = "Screwdown"
-        
-        if tab == 'bending':
-            ref_color = BENDING_REF_COLOR
-            actual_color = BENDING_ACTUAL_COLOR
-            ref_name = "Sollbiegung"
-            actual_name = "Istbiegung"
-            tab_title = "Bending"
-        elif tab == 'profile':
-            ref_color = PROFILE_REF_COLOR
-            actual_color = PROFILE_ACTUAL_COLOR
-            ref_name = "Sollanstellung"
-            actual_name = "Istanstellung"
-            tab_title = "Profile"
-
-        # Add reference data
-        if 'is_midpoint' in data:
-            is_midpoint = data['is_midpoint']
-            
-            #Create arrays for regular points only (for visible line)
-            regular_x = []
-            regular_z = []
-            
-            # Create arrays for all points (for hover)
-            all_x = data['ref_x']
-            all_z = data['ref_z']
-            
-            for i, is_mid in enumerate(is_midpoint):
-                if not is_mid:  # Only regular points for visible line
-                    regular_x.append(data['ref_x'][i])
-                    regular_z.append(data['ref_z'][i])
-            
-            # Add visible line with only regular points
-            fig.add_trace(go.Scatter(
-                x=regular_x,
-                y=regular_z,
-                mode='lines+markers',
-                name=ref_name,
-                line=dict(color=ref_color, width=2),
-                marker=dict(size=6)
-            ))
-            
-            # Add invisible hover trace for all points (including midpoints)
-            fig.add_trace(go.Scatter(
-                x=all_x,
-                y=all_z,
-                mode='markers',
-                name=f'{ref_name} (Hover)',
-                marker=dict(size=8, opacity=0),  # Invisible markers
-                hovertemplate=f'<b>{ref_name}</b><br>X: %{{x:.1f}}<br>Z: %{{y:.1f}}<extra></extra>',
-                showlegend=False
-            ))
-        else:
-            # Fallback for data without midpoint information
-            fig.add_trace(go.Scatter(
-                x=data['ref_x'],
-                y=data['ref_z'],
-                mode='lines+markers',
-                name=ref_name,
-                line=dict(color=ref_color, width=2)
-            ))
-
-        # Add actual data for selected row
-        if selected_row >= 0 and selected_row < data['actual_x'].shape[0]:
-            fig.add_trace(go.Scatter(
-                x=data['actual_x'][selected_row],
-                y=data['actual_z'][selected_row],
-                mode='lines+markers',
-                name=actual_name,
-                line=dict(color=actual_color, width=2)
-            ))
-        else:
-            fig.add_trace(go.Scatter(
-                x=data['actual_x'][0],
-                y=data['actual_z'][0],
-                mode='lines+markers',
-                name=actual_name,
-                line=dict(color=actual_color, width=2)
-            ))
-
-        # Set appropriate y-axis title based on tab
-        y_title = "Z Position"
-        if tab == 'bending':
-            y_title = _('bending_label')
-        elif tab == 'profile':
-            y_title = "Anstellung [mm]"
-        elif tab == 'screwdown':
-            y_title = "Z Position"
-
-        # Set axis ranges based on zoom state
-        xaxis_config = dict(
-            title=_('position_label'),
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='lightgray'
-        )
-        
-        yaxis_config = dict(
-            title=y_title,
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='lightgray'
-        )
-        
-        # Apply zoom state
-        if zoom_state == 'auto':
-            xaxis_config['autorange'] = True
-            yaxis_config['autorange'] = True
-        elif zoom_state == 'default':
-            pass
-        elif zoom_state == 'zoom_in':
-            x_values = []
-            y_values = []
-            
-            for trace in fig.data:
-                x_values.extend(trace.x)
-                y_values.extend(trace.y)
-            
-            if x_values and y_values:
-                x_min, x_max = min(x_values), max(x_values)
-                y_min, y_max = min(y_values), max(y_values)
-                
-                x_range = x_max - x_min
-                y_range = y_max - y_min
-                
-                x_center = (x_min + x_max) / 2
-                y_center = (y_min + y_max) / 2
-                
-                xaxis_config['range'] = [x_center - x_range * 0.375, x_center + x_range * 0.375]
-                yaxis_config['range'] = [y_center - y_range * 0.375, y_center + y_range * 0.375]
-        elif zoom_state == 'zoom_out':
-            x_values = []
-            y_values = []
-            
-            for trace in fig.data:
-                x_values.extend(trace.x)
-                y_values.extend(trace.y)
-            
-            if x_values and y_values:
-                x_min, x_max = min(x_values), max(x_values)
-                y_min, y_max = min(y_values), max(y_values)
-                
-                x_range = x_max - x_min
-                y_range = y_max - y_min
-                
-                x_center = (x_min + x_max) / 2
-                y_center = (y_min + y_max) / 2
-                
-                xaxis_config['range'] = [x_center - x_range * 0.625, x_center + x_range * 0.625]
-                yaxis_config['range'] = [y_center - y_range * 0.625, y_center + y_range * 0.625]
-
-        # Proper fullscreen height
-        height = 700 if is_fullscreen else 400
-
-        fig.update_layout(
-            xaxis=xaxis_config,
-            yaxis=yaxis_config,
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="left", x=0),
-            margin=dict(l=40, r=40, t=40, b=40),
-            height=height,
-            plot_bgcolor="white",
-            paper_bgcolor="white",
-            font=dict(size=12 if is_fullscreen else 10)
-        )
-
         graph_panel = html.Div([
             html.Div([
-                html.H5(_('graph_title', tab_title, actual_blank_info), className="m-0")
+                html.H5(_('all_data_graph_title', actual_blank_info), id='combined-graph-title', className="m-0")
             ], className="d-flex justify-content-between align-items-center px-3 py-2", 
                style={"backgroundColor": "#0275d8", "color": "white", "borderTopLeftRadius": "4px", "borderTopRightRadius": "4px"}),
             
-            html.Div([
-                html.P(_('actual_vs_ref', tab_title, actual_blank_info), className="m-0 text-muted")
-            ], className="px-3 py-2 bg-light border-bottom"),
-            
             dcc.Graph(
-                id='individual-graph',
-                figure=fig,
+                id='combined-graph',
+                figure=create_combined_graph(selected_row, zoom_state, is_fullscreen),
                 config={
                     'displayModeBar': True,
                     'modeBarButtonsToAdd': ['autoScale2d', 'resetScale2d', 'zoomIn2d', 'zoomOut2d'],
@@ -1500,7 +1884,9 @@ def create_graph_section(tab, selected_row, zoom_state='default', is_fullscreen=
                     'displaylogo': False
                 },
                 style={"height": "700px" if is_fullscreen else "400px", "padding": "10px", "backgroundColor": "white"}
-            )
+            ),
+            # x range the user zoomed to, refined again after a row change (refine_combined_zoom)
+            dcc.Store(id='combined-x-range', data=None)
         ], style={
             "border": "1px solid #ccc",
             "borderRadius": "4px",
@@ -1513,27 +1899,137 @@ def create_graph_section(tab, selected_row, zoom_state='default', is_fullscreen=
         })
         
         return graph_panel
+        
+    # For individual tabs, show a single graph
+    if tab not in data_store:
+        return html.Div(f"⚠️ No data for {tab} graph", className="alert alert-warning")
 
-    except Exception as e:
-        error_msg = f"❌ Error in graph: {str(e)}"
-        print(f"[ERROR] {error_msg}")
-        print(f"[ERROR] Traceback: {traceback.format_exc()}")
-        return html.Div([
-            html.P(error_msg, className="alert alert-danger"),
-            html.Pre(traceback.format_exc(), className="bg-light p-3 small")
-        ])
+    data = data_store[tab]
+
+    if not all(k in data for k in ['actual_x', 'actual_z', 'ref_x', 'ref_z']):
+        return html.Div(f"⚠️ Missing data keys for {tab} graph", className="alert alert-warning")
+
+    if (len(data['ref_x'])== 0 or len(data['ref_z']) == 0 or 
+        data['actual_x'].size == 0 or data['actual_z'].size == 0):
+        return html.Div(f"⚠️ Empty data arrays for {tab} graph", className="alert alert-warning")
+
+    # Set colors and names based on tab
+    ref_name, actual_name, ref_color, actual_color, tab_title = TAB_SERIES.get(tab, TAB_SERIES['screwdown'])
+
+    fig = _build_tab_figure(tab, selected_row, zoom_state, is_fullscreen, ref_name, ref_color,
+                            actual_name, actual_color, LANGUAGE, DATA_VERSION)
+
+    graph_panel = html.Div([
+        html.Div([
+            html.H5(_('graph_title', tab_title, actual_blank_info), id='individual-graph-title', className="m-0")
+        ], className="d-flex justify-content-between align-items-center px-3 py-2", 
+           style={"backgroundColor": "#0275d8", "color": "white", "borderTopLeftRadius": "4px", "borderTopRightRadius": "4px"}),
+        
+        html.Div([
+            html.P(_('actual_vs_ref', tab_title, actual_blank_info), id='individual-graph-subtitle', className="m-0 text-muted")
+        ], className="px-3 py-2 bg-light border-bottom"),
+        
+        dcc.Graph(
+            id='individual-graph',
+            figure=fig,
+            config={
+                'displayModeBar': True,
+                'modeBarButtonsToAdd': ['autoScale2d', 'resetScale2d', 'zoomIn2d', 'zoomOut2d'],
+                'modeBarButtonsToRemove': ['lasso2d', 'select2d'],
+                'displaylogo': False
+            },
+            style={"height": "700px" if is_fullscreen else "400px", "padding": "10px", "backgroundColor": "white"}
+        ),
+        # x range the user zoomed to, refined again after a row change (refine_individual_zoom)
+        dcc.Store(id='individual-x-range', data=None)
+    ], style={
+        "border": "1px solid #ccc",
+        "borderRadius": "4px",
+        "overflow": "hidden",
+        "marginTop": "20px",
+        "marginBottom": "20px",
+        "boxShadow": "0 2px 4px rgba(0,0,0,0.1)",
+        "maxWidth": "100%",
+        "width": "100%"
+    })
+    
+    return graph_panel
+
+@functools.lru_cache(maxsize=256)
+def _build_tab_figure(tab, selected_row, zoom_state, is_fullscreen, ref_name, ref_color,
+                      actual_name, actual_color, language, data_version):
+    """Figure dict of one data type for one row; language and data_version only key the cache."""
+    data = data_store[tab]
+    
+    # Fall back to the first row when the selected one is out of range
+    row = selected_row if 0 <= selected_row < data['actual_x'].shape[0] else 0
+    row_x, row_z = display_row(data, row)
+    
+    traces = [
+        # Reference data; midpoints only show up on hover
+        reference_trace(data, ref_name, ref_color),
+        dict(
+            type='scattergl',
+            x=row_x,
+            y=row_z,
+            mode=actual_trace_mode(is_reduced(data)),
+            name=actual_name,
+            line=dict(color=actual_color, width=2)
+        ),
+    ]
+
+    # Set appropriate y-axis title based on tab
+    y_title = "Z Position"
+    if tab == 'bending':
+        y_title = T.bending_label
+    elif tab == 'profile':
+        y_title = "Anstellung [mm]"
+    elif tab == 'screwdown':
+        y_title = "Z Position"
+
+    # Set axis ranges based on zoom state
+    xaxis_config = {**AXIS_GRID, 'title': T.position_label}
+    yaxis_config = {**AXIS_GRID, 'title': y_title}
+
+    # Apply zoom state
+    if zoom_state == 'auto':
+        xaxis_config['autorange'] = True
+        yaxis_config['autorange'] = True
+    else:
+        zoom_ranges = tab_zoom_ranges(traces, zoom_state)
+        if zoom_ranges is not None:
+            xaxis_config['range'], yaxis_config['range'] = zoom_ranges
+
+    # Proper fullscreen height
+    height = 700 if is_fullscreen else 400
+
+    layout = dict(
+        xaxis=xaxis_config,
+        yaxis=yaxis_config,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="left", x=0),
+        margin=dict(l=40, r=40, t=40, b=40),
+        height=height,
+        uirevision=f"{current_file_name}:{tab}:{zoom_state}",
+        plot_bgcolor="white",
+        paper_bgcolor="white",
+        font=dict(size=12 if is_fullscreen else 10)
+    )
+
+    # A plain figure dict skips Plotly's per-trace validation; dcc.Graph takes it as is
+    return dict(data=traces, layout=layout)
 
 # Callback to update the page content based on URL
 @app.callback(
     Output('page-content', 'children'),
-    [Input('url', 'pathname')]
+    [Input('url', 'pathname')],
+    [State('file-list-store', 'data')]
 )
-def display_page(pathname):
+def display_page(pathname, h5_files):
     if pathname == '/' or pathname == '/select_database':
-        return create_file_selection_layout()
+        return create_file_selection_layout(h5_files)
     elif pathname == '/visualize':
         if not data_store:
-            return create_error_layout(_('no_data'))
+            return create_error_layout(T.no_data)
         return create_visualization_layout()
     elif pathname and pathname.startswith('/load/'):
         file_name = pathname.split('/load/')[1]
@@ -1542,7 +2038,7 @@ def display_page(pathname):
             print(f"[INFO] Found file at: {file_path}")
             if handle_h5_file_loading(file_path):
                 return dcc.Location(pathname="/visualize", id="redirect-to-visualize")
-        return create_error_layout(_('missing_data').format(file_name))
+        return create_error_layout(T.missing_data.format(file_name))
     elif pathname == '/back':
         if len(file_history) > 1:
             file_history.pop()
@@ -1555,6 +2051,22 @@ def display_page(pathname):
     else:
         return create_error_layout("Page not found")
 
+# Callback to refresh the cached file list; the only place the data directories are scanned for the UI
+@app.callback(
+    Output('file-list-store', 'data'),
+    [Input('file-list-interval', 'n_intervals')]
+)
+def refresh_file_list(n_intervals):
+    return find_h5_files()
+
+# Callback to render the file list whenever the cached list changes
+@app.callback(
+    Output('file-list-container', 'children'),
+    [Input('file-list-store', 'data')]
+)
+def update_file_list(h5_files):
+    return create_file_list(h5_files)
+
 # Callback for the load file button
 @app.callback(
     Output('url', 'pathname'),
@@ -1582,789 +2094,260 @@ def back_button(n_clicks):
 # Callback to update file info
 @app.callback(
     Output('file-info', 'children'),
-    [Input('url', 'pathname')]
+    [Input('url', 'pathname'),
+     Input('applied-language', 'data')]
 )
-def update_file_info(pathname):
+def update_file_info(pathname, language):
     if current_file_name:
         return html.Div([
-            html.P(_('currently_viewing'), className="mb-0"),
+            html.P(T.currently_viewing, className="mb-0"),
             html.Strong(current_file_name)
         ])
     else:
-        return html.Div(_('no_file_selected'), className="text-danger")
+        return html.Div(T.no_file_selected, className="text-danger")
 
 # Callback to update max row value
 @app.callback(
-    Output('max-row', 'children'),
+    Output('max-row', 'data'),
     [Input('tabs', 'value')]
 )
 def update_max_row(tab):
     if not data_store:
-        return "0"
+        return 0
     
     if tab == 'all_data' and 'screwdown' in data_store:
         data = data_store['screwdown']
     elif tab not in data_store:
-        return "0"
+        return 0
     else:
         data = data_store[tab]
     
-    if 'actual_x' not in data or not hasattr(data['actual_x'], 'shape'):
-        return "0"
+    # The loader only stores ndarrays, so a present actual_x always has a shape
+    if 'actual_x' not in data:
+        return 0
         
-    return str(data['actual_x'].shape[0])
+    return data['actual_x'].shape[0]
 
-# FIXED: Simplified row selection callback that handles all navigation with proper blank info mapping
+# Row selection from the table
 @app.callback(
-    Output('selected-row', 'children'),
-    [
-        Input('jump-previous-button', 'n_clicks'),
-        Input('jump-next-button', 'n_clicks'),
-        Input({'type': 'row-select-btn', 'index': dash.dependencies.ALL}, 'n_clicks'),
-        Input('auto-advance-interval', 'n_intervals'),
-        Input('jump-to-row-button', 'n_clicks')
-    ],
-    [
-        State('selected-row', 'children'),
-        State('max-row', 'children'),
-        State('auto-advance-state', 'children'),
-        State('jump-to-row-input', 'value')
-    ],
+    Output('selected-row', 'data'),
+    [Input('data-table', 'active_cell')],
+    [State('selected-row', 'data'),
+     State('max-row', 'data')],
     prevent_initial_call=True
 )
-def handle_row_selection(prev_clicks, next_clicks, row_button_clicks, 
-                        auto_intervals, jump_clicks, current_row, max_row, 
-                        auto_advance_state, jump_value):
-    """Handle all row selection and navigation with fixed jump functionality"""
-    
-    ctx = dash.callback_context
-    if not ctx.triggered:
+def handle_row_selection(active_cell, current_row, max_row):
+    """Select the row of a clicked table cell; prev/next/jump and auto-advance run clientside"""
+    if not active_cell or active_cell.get('row_id') is None or not max_row:
         return dash.no_update
     
-    trigger = ctx.triggered[0]
-    trigger_id = trigger['prop_id']
-    
-    print(f"[DEBUG] ROW SELECTION - Trigger: {trigger_id}")
-    
-    # Convert values safely
-    try:
-        current_row_int = int(current_row) if current_row and str(current_row) != '-1' else 0
-        max_row_int = int(max_row) if max_row else 0
-    except (ValueError, TypeError):
-        print(f"[ERROR] Invalid row values: current_row={current_row}, max_row={max_row}")
-        return "0"
-    
-    if max_row_int <= 0:
-        print("[DEBUG] No data available")
-        return "0"
-    
-    new_row = current_row_int
-    
-    # Handle Previous button
-    if 'jump-previous-button' in trigger_id:
-        new_row = max(0, current_row_int - 1)
-        print(f"[DEBUG] PREVIOUS: {current_row_int} -> {new_row}")
-    
-    # Handle Next button
-    elif 'jump-next-button' in trigger_id:
-        new_row = min(max_row_int - 1, current_row_int + 1)
-        print(f"[DEBUG] NEXT: {current_row_int} -> {new_row}")
-    
-    # Handle row selection buttons
-    elif 'row-select-btn' in trigger_id:
-        try:
-            import json
-            button_id = json.loads(trigger_id.split('.')[0])
-            row_index = button_id['index']
-            button_idx = next((i for i, x in enumerate(ctx.inputs_list[2]) if x['id'] == button_id), None)
-            if button_idx is not None and row_button_clicks[button_idx] > 0:
-                new_row = row_index
-                print(f"[DEBUG] ROW SELECT BUTTON: selected row {new_row}")
-            else:
-                return dash.no_update
-        except Exception as e:
-            print(f"[ERROR] Failed to parse row button: {e}")
-            return dash.no_update
-    
-    # FIXED: Handle jump to specific blank info number
-    elif 'jump-to-row-button' in trigger_id:
-        if jump_value is not None:
-            try:
-                target_blank_info = int(jump_value)
-                print(f"[DEBUG] JUMP TO: Looking for blank info {target_blank_info}")
-                
-                # Get the blank info data to find the correct row index
-                blank_info_data = data_store.get('blank_info', {}).get('data', [])
-                
-                if isinstance(blank_info_data, np.ndarray) and len(blank_info_data) > 0:
-                    # Find the row index that corresponds to the target blank info number
-                    matching_indices = np.where(blank_info_data == target_blank_info)[0]
-                    
-                    if len(matching_indices) > 0:
-                        new_row = matching_indices[0]  # Take the first match
-                        print(f"[DEBUG] JUMP TO: Found blank info {target_blank_info} at row index {new_row}")
-                        
-                        # Validate the row is within bounds
-                        if 0 <= new_row < max_row_int:
-                            print(f"[DEBUG] JUMP TO: Successfully jumping to row {new_row}")
-                        else:
-                            print(f"[WARNING] Jump target row {new_row} out of range (0-{max_row_int-1})")
-                            return dash.no_update
-                    else:
-                        print(f"[WARNING] Blank info {target_blank_info} not found in data")
-                        return dash.no_update
-                else:
-                    # Fallback to old logic if blank_info_data is not available
-                    print("[WARNING] No blank info data available, using fallback logic")
-                    new_row = target_blank_info - 1  # Convert 1-based to 0-based
-                    if 0 <= new_row < max_row_int:
-                        print(f"[DEBUG] JUMP TO: Fallback jump to row {new_row}")
-                    else:
-                        print(f"[WARNING] Fallback jump value {target_blank_info} out of range (1-{max_row_int})")
-                        return dash.no_update
-                        
-            except (ValueError, TypeError):
-                print(f"[ERROR] Invalid jump value: {jump_value}")
-                return dash.no_update
-        else:
-            return dash.no_update
-    
-    # Handle auto-advance
-    elif 'auto-advance-interval' in trigger_id:
-        if auto_advance_state == 'true':
-            new_row = (current_row_int + 1) % max_row_int
-            print(f"[DEBUG] AUTO-ADVANCE: {current_row_int} -> {new_row}")
-        else:
-            return dash.no_update
+    logger.debug("ROW SELECTION - Cell: %s", active_cell)
     
     # Ensure new_row is within bounds
-    new_row = max(0, min(new_row, max_row_int - 1))
+    new_row = max(0, min(active_cell['row_id'], max_row - 1))
     
     # Only update if the row actually changed
-    if new_row != current_row_int:
-        print(f"[DEBUG] FINAL ROW SELECTION: {current_row_int} -> {new_row}")
-        return str(new_row)
+    if new_row != current_row:
+        logger.debug("FINAL ROW SELECTION: %s -> %s", current_row, new_row)
+        return new_row
     else:
-        print(f"[DEBUG] No row change needed: staying at {current_row_int}")
+        logger.debug("No row change needed: staying at %s", current_row)
         return dash.no_update
 
-# Callback to update current row display
-@app.callback(
-    Output('current-row-display', 'children'),
-    [Input('selected-row', 'children')]
+# Clientside row navigation: prev/next steps and jump to a blank info number
+app.clientside_callback(
+    ClientsideFunction(namespace='viz', function_name='navigate_row'),
+    Output('selected-row', 'data', allow_duplicate=True),
+    [Input('jump-previous-button', 'n_clicks'),
+     Input('jump-next-button', 'n_clicks'),
+     Input('jump-to-row-button', 'n_clicks')],
+    [State('jump-to-row-input', 'value'),
+     State('selected-row', 'data'),
+     State('max-row', 'data'),
+     State('actual-store', 'data')],
+    prevent_initial_call=True
 )
-def update_current_row_display(selected_row):
-    if selected_row and selected_row != '-1':
-        try:
-            row_num = int(selected_row)
-            # Get the actual blank info number for display
-            blank_info_data = data_store.get('blank_info', {}).get('data', [])
-            if isinstance(blank_info_data, np.ndarray) and len(blank_info_data) > row_num >= 0:
-                actual_blank_info = blank_info_data[row_num]
-                return _('current_row', actual_blank_info)
-            else:
-                return _('current_row', row_num + 1)
-        except (ValueError, TypeError):
-            return _('current_row', 1)
-    else:
-        return _('current_row', 1)
 
-# Page navigation callback that properly updates table display
+# The table shell only changes with the tab; paging and its records run clientside (assets/viz.js)
 @app.callback(
-    Output('page-store', 'children'),
+    Output('table-container', 'children'),
+    [Input('tabs', 'value'),
+     Input('applied-language', 'data')]
+)
+def update_table(tab, language):
+    return create_data_table(tab)
+
+# Page of the selected row, or one page back/forward
+app.clientside_callback(
+    ClientsideFunction(namespace='viz', function_name='update_page'),
+    Output('page-store', 'data'),
     [Input('prev-button', 'n_clicks'),
      Input('next-button', 'n_clicks'),
      Input('tabs', 'value'),
-     Input('selected-row', 'children')],
-    [State('page-store', 'children'),
-     State('max-row', 'children')]
+     Input('selected-row', 'data')],
+    [State('max-row', 'data'),
+     State('page-store', 'data'),
+     State('page-size', 'data')]
 )
-def update_page_navigation(prev_clicks, next_clicks, tab, selected_row, current_page, max_row):
-    """Handle pagination with proper page calculation based on selected row"""
-    ctx = dash.callback_context
-    if not ctx.triggered:
-        return 1
-    
-    trigger_id = ctx.triggered[0]['prop_id'].split('.')[0]
-    
-    # Reset to page 1 when tab changes
-    if trigger_id == 'tabs':
-        print(f"[DEBUG] Tab changed to {tab}, resetting to page 1")
-        return 1
-    
-    current_page = int(current_page) if current_page else 1
-    max_row = int(max_row) if max_row else 0
-    rows_per_page = 5
-    max_pages = math.ceil(max_row / rows_per_page) if max_row > 0 else 1
-    
-    # If selected row changed, calculate which page it should be on
-    if trigger_id == 'selected-row' and selected_row and selected_row != '-1':
-        try:
-            selected_row_int = int(selected_row)
-            # Calculate which page this row should be on (1-based)
-            page_for_row = (selected_row_int // rows_per_page) + 1
-            print(f"[DEBUG] Selected row {selected_row_int} should be on page {page_for_row}")
-            return page_for_row
-        except (ValueError, TypeError):
-            return current_page
-    
-    # Handle pagination button clicks
-    if trigger_id == 'prev-button' and prev_clicks:
-        new_page = max(1, current_page - 1)
-        print(f"[DEBUG] Previous page: {current_page} -> {new_page}")
-        return new_page
-    elif trigger_id == 'next-button' and next_clicks:
-        new_page = min(current_page + 1, max_pages)
-        print(f"[DEBUG] Next page: {current_page} -> {new_page}")
-        return new_page
-    
-    return current_page
-
-# Callback to update pagination controls
+
+# Values of the visible page; also runs when a new visualization layout is inserted
 @app.callback(
-    Output('pagination-controls', 'children'),
-    [Input('page-store', 'children'),
-     Input('max-row', 'children')]
+    Output('table-cells', 'data'),
+    [Input('page-store', 'data')]
+)
+def load_table_page(page):
+    logger.debug("Loading table page %s", page)
+    return create_table_cells(page)
+
+# Records and selected-row highlight of the visible page; also clears the active cell
+app.clientside_callback(
+    ClientsideFunction(namespace='viz', function_name='table_records'),
+    [Output('data-table', 'data'),
+     Output('data-table', 'style_data_conditional'),
+     Output('data-table', 'active_cell'),
+     Output('data-table', 'selected_cells')],
+    [Input('table-cells', 'data'),
+     Input('selected-row', 'data'),
+     Input('current-language', 'children')],
+    [State('tabs', 'value'),
+     State('page-size', 'data'),
+     State('table-store', 'data'),
+     State('i18n-store', 'data')]
 )
-def update_pagination_controls(page, max_row):
-    page = int(page) if page else 1
-    max_row = int(max_row) if max_row else 0
-    rows_per_page = 5
-    max_pages = math.ceil(max_row / rows_per_page) if max_row > 0 else 1
-    
-    print(f"[DEBUG] Pagination controls: page={page}, max_pages={max_pages}, max_row={max_row}")
-    
-    return html.Div([
-        html.Button(_('previous_button'), id="prev-button", 
-                  className="btn btn-outline-primary me-2",
-                  disabled=page <= 1),
-        html.Span(f"{_('page')} {page} {_('of')} {max_pages}", className="mx-2"),
-        html.Button(_('next_button'), id="next-button", 
-                  className="btn btn-outline-primary ms-2",
-                  disabled=page >= max_pages)
-    ])
 
-# Table callback that properly uses page number for data filtering
-@app.callback(
-    Output('table-container', 'children'),
-    [Input('tabs', 'value'),
-     Input('page-store', 'children'),
-     Input('selected-row', 'children')]
+# Row badge in the current language
+app.clientside_callback(
+    ClientsideFunction(namespace='viz', function_name='row_display'),
+    Output('current-row-display', 'children'),
+    [Input('selected-row', 'data'),
+     Input('current-language', 'children')],
+    [State('actual-store', 'data'),
+     State('i18n-store', 'data')]
 )
-def update_table(tab, page, selected_row):
+
+# Page label and prev/next page buttons
+app.clientside_callback(
+    ClientsideFunction(namespace='viz', function_name='page_controls'),
+    [Output('page-display', 'children'),
+     Output('prev-button', 'disabled'),
+     Output('next-button', 'disabled')],
+    [Input('page-store', 'data'),
+     Input('max-row', 'data'),
+     Input('current-language', 'children')],
+    [State('page-size', 'data'),
+     State('i18n-store', 'data')]
+)
+
+@functools.lru_cache(maxsize=8)
+def table_columns(prefixes, num_display_columns):
+    """DataTable columns: index, blank info and values, then the data points of every series interleaved."""
+    return tuple([{"name": "Index", "id": "index"},
+                  {"name": "Blank Info", "id": "blank_info"},
+                  {"name": "Values", "id": "values"}] +
+                 [{"name": f"{prefix}{j}", "id": f"{prefix}{j}"}
+                  for j in range(num_display_columns) for prefix in prefixes])
+
+def create_table_store():
+    """Per-file data of the clientside table: reference texts, series and sizes; the values come per page."""
+    shapes = data_store.get('shapes', {})
+    max_rows = shapes.get('max_rows_all', 0)
+    display_columns = {'all_data': min(shapes.get('max_points_all', 0), TABLE_MAX_POINTS)}
+    ref_display = {}
+    for data_type in H5_DATA_TYPES:
+        data = data_store.get(data_type) or {}
+        if 'actual_x' in data:
+            display_columns[data_type] = min(data['actual_x'].shape[1], TABLE_MAX_POINTS)
+            ref_display[data_type] = data['ref_display'][:TABLE_MAX_POINTS]
+    
+    return {
+        "series": TABLE_SERIES,
+        "display_columns": display_columns,
+        "ref_display": ref_display,
+        "blank_info": blank_info_range(),
+        "max_rows": max_rows,
+        "row_colors": TABLE_ROW_COLORS,
+        "selected_color": SELECTED_ROW_COLOR,
+    }
+
+def create_table_cells(page):
+    """Actual values of the rows on one table page, for every data type.
+    
+    Only these rows are read, so memory-mapped data stays on disk apart from them.
+    """
+    start = (page - 1) * config.rows_per_page
+    stop = start + config.rows_per_page
+    cells = {}
+    for data_type in H5_DATA_TYPES:
+        data = data_store.get(data_type) or {}
+        if 'actual_x' in data:
+            columns = min(data['actual_x'].shape[1], TABLE_MAX_POINTS)
+            # Only the columns the table shows, truncated like int(); independent of
+            # how the graphs reduce their traces
+            cells[data_type] = {
+                "x": data['actual_x'][start:stop, :columns].astype(np.int64).tolist(),
+                "z": data['actual_z'][start:stop, :columns].astype(np.int64).tolist(),
+            }
+    
+    return {"page": page, "start": start, "cells": cells}
+
+def create_data_table(tab):
+    """Data table of a tab without records; viz.table_records fills in the visible page."""
+    return _build_table(tab, LANGUAGE, DATA_VERSION)
+
+@functools.lru_cache(maxsize=8)
+def _build_table(tab, language, data_version):
+    """Table shell of one tab; language and data_version only key the cache."""
     try:
-        print(f"[DEBUG] UPDATE TABLE - tab: {tab}, page: {page}, selected_row: {selected_row}")
+        logger.debug("UPDATE TABLE - tab: %s", tab)
         if not data_store:
-            return html.Div(_('no_data_table'), className="alert alert-warning")
-
-        page = int(page) if page else 1
-        selected_row = int(selected_row) if selected_row and selected_row != '-1' else -1
-
-        sd_data = data_store.get('screwdown', {})
-        bd_data = data_store.get('bending', {})
-        pd_data = data_store.get('profile', {})
-
-        if not all(k in sd_data for k in ['actual_x', 'actual_z', 'ref_x', 'ref_z']):
-            return html.Div(_('missing_data').format('screwdown'), className="alert alert-warning")
-        if not all(k in bd_data for k in ['actual_x', 'actual_z', 'ref_x', 'ref_z']):
-            return html.Div(_('missing_data').format('bending'), className="alert alert-warning")
-        if not all(k in pd_data for k in ['actual_x', 'actual_z', 'ref_x', 'ref_z']):
-            return html.Div(_('missing_data').format('profile'), className="alert alert-warning")
-
-        max_rows = min(
-            sd_data['actual_x'].shape[0],
-            bd_data['actual_x'].shape[0],
-            pd_data['actual_x'].shape[0]
-        )
+            return html.Div(T.no_data_table, className="alert alert-warning")
 
-        # Get the continuous blank info data
-        blank_info_data = data_store.get('blank_info', {}).get('data', [])
-        
-        rows_per_page = 5
-        
-        # Use the page number to determine which rows to show
-        start_idx = (page - 1) * rows_per_page
-        end_idx = min(start_idx + rows_per_page, max_rows)
-        
-        print(f"[DEBUG] Showing rows {start_idx} to {end_idx-1} (page {page})")
-
-        table_container = html.Div(style={
-            "display": "grid",
-            "gridTemplateColumns": "60px 100px 80px 1fr",
-            "gap": "0px",
-            "border": f"1px solid {BORDER_COLOR}",
-            "width": "max-content",
-            "minWidth": "100%"
-        })
-        
-        # Create header row
-        header_row = html.Div(style={
-            "display": "contents",
-            "fontWeight": "bold",
-            "backgroundColor": "#f8f9fa"
-        })
-        
-        # Add header cells
-        header_row.children = [
-            html.Div("Index", style={
-                "padding": "8px",
-                "textAlign": "center",
-                "border": f"1px solid {BORDER_COLOR}",
-                "backgroundColor": "white",
-                "position": "sticky",
-                "left": "0",
-                "zIndex": "2"
-            }),
-            html.Div("Blank Info", style={
-                "padding": "8px",
-                "textAlign": "center",
-                "border": f"1px solid {BORDER_COLOR}",
-                "backgroundColor": "white",
-                "position": "sticky",
-                "left": "60px",
-                "zIndex": "2"
-            }),
-            html.Div("Values", style={
-                "padding": "8px",
-                "textAlign": "center",
-                "border": f"1px solid {BORDER_COLOR}",
-                "backgroundColor": "white",
-                "position": "sticky",
-                "left": "160px",
-                "zIndex": "2"
-            })
-        ]
-        
-        # Add data column headers
+        for data_type in H5_DATA_TYPES:
+            if not all(k in data_store.get(data_type, {}) for k in ['actual_x', 'actual_z', 'ref_x', 'ref_z']):
+                return html.Div(T.missing_data.format(data_type), className="alert alert-warning")
+
+        series = TABLE_SERIES.get(tab, TABLE_SERIES['screwdown'])
         if tab == 'all_data':
-            data_headers = []
-            
-            max_points = max(
-                sd_data['actual_x'].shape[1] if 'actual_x' in sd_data and hasattr(sd_data['actual_x'], 'shape') else 0,
-                bd_data['actual_x'].shape[1] if 'actual_x' in bd_data and hasattr(bd_data['actual_x'], 'shape') else 0,
-                pd_data['actual_x'].shape[1] if 'actual_x' in pd_data and hasattr(pd_data['actual_x'], 'shape') else 0
-            )
-            
-            max_display_points = min(max_points, 25)
-            total_columns = max_display_points * 3
-            
-            for i in range(0, max_display_points):
-                data_headers.append(html.Div(f"SD{i}", style={
-                    "padding": "8px",
-                    "textAlign": "center",
-                    "border": f"1px solid {BORDER_COLOR}",
-                    "minWidth": "120px"
-                }))
-                
-                data_headers.append(html.Div(f"BD{i}", style={
-                    "padding": "8px",
-                    "textAlign": "center",
-                    "border": f"1px solid {BORDER_COLOR}",
-                    "minWidth": "120px"
-                }))
-                
-                data_headers.append(html.Div(f"PD{i}", style={
-                    "padding": "8px",
-                    "textAlign": "center",
-                    "border": f"1px solid {BORDER_COLOR}",
-                    "minWidth": "120px"
-                }))
-            
-            data_headers_container = html.Div(data_headers, style={
-                "display": "grid",
-                "gridTemplateColumns": f"repeat({total_columns}, minmax(120px, 1fr))",
-                "gap": "0px"
-            })
-            
-            header_row.children.append(data_headers_container)
+            num_display_columns = min(data_store['shapes']['max_points_all'], TABLE_MAX_POINTS)
         else:
-            data = {'screwdown': sd_data, 'bending': bd_data, 'profile': pd_data}.get(tab, sd_data)
-            prefix = {'screwdown': 'SD', 'bending': 'BD', 'profile': 'PD'}.get(tab, 'SD')
-            
-            num_columns = data['actual_x'].shape[1] if 'actual_x' in data and hasattr(data['actual_x'], 'shape') else 0
-            num_display_columns = min(num_columns, 25)
-            
-            data_headers = []
-            for i in range(0, num_display_columns):
-                data_headers.append(html.Div(f"{prefix}{i}", style={
-                    "padding": "8px",
-                    "textAlign": "center",
-                    "border": f"1px solid {BORDER_COLOR}",
-                    "minWidth": "120px"
-                }))
-                
-            data_headers_container = html.Div(data_headers, style={
-                "display": "grid",
-                "gridTemplateColumns": f"repeat({num_display_columns}, minmax(120px, 1fr))",
-                "gap": "0px"
-            })
-            
-            header_row.children.append(data_headers_container)
+            num_display_columns = min(data_store[series[0][1]]['actual_x'].shape[1], TABLE_MAX_POINTS)
         
-        table_container.children = [header_row]
-        
-        # Create data rows for the current page
-        for i in range(start_idx, end_idx):
-            is_selected = (i == selected_row)
-            
-            # Get the actual blank info number for this row
-            if isinstance(blank_info_data, np.ndarray) and len(blank_info_data) > i:
-                actual_blank_info = blank_info_data[i]
-            else:
-                actual_blank_info = i + 1
-            
-            ref_row_style = {
-                "display": "contents",
-                "backgroundColor": REF_COLOR
-            }
-
-            if is_selected:
-                ref_row_style["backgroundColor"] = "#e6f7ff"
-            
-            ref_row = html.Div(style=ref_row_style)
-            
-            # Make row selection buttons more responsive
-            index_cell = html.Div([
-                html.Button(
-                    "✓" if is_selected else str(i + 1),
-                    id={'type': 'row-select-btn', 'index': i},
-                    className="btn btn-sm btn-primary" if is_selected else "btn btn-sm btn-outline-secondary",
-                    style={
-                        "width": "40px", 
-                        "height": "30px", 
-                        "padding": "0", 
-                        "borderRadius": "4px",
-                        "fontWeight": "bold",
-                        "fontSize": "12px"
-                    }
-                )
-            ], style={
-                "padding": "8px",
-                "textAlign": "center",
-                "border": f"1px solid {BORDER_COLOR}",
-                "backgroundColor": "#e6f7ff" if is_selected else "white",
-                "position": "sticky",
-                "left": "0",
-                "zIndex": "1",
-                "gridRow": "span 2"
-            })
-            
-            # Display the continuous blank info number
-            blank_info_cell = html.Div(str(actual_blank_info), style={
-                "padding": "8px",
-                "textAlign": "center",
-                "border": f"1px solid {BORDER_COLOR}",
-                "backgroundColor": "#e6f7ff" if is_selected else "white",
-                "position": "sticky",
-                "left": "60px",
-                "zIndex": "1",
-                "gridRow": "span 2"
-            })
-            
-            ref_label_cell = html.Div(html.Span(_('ref_label'), style={"color": "black", "fontWeight": "bold"}), style={
-                "padding": "8px",
-                "textAlign": "center",
-                "border": f"1px solid {BORDER_COLOR}",
-                "backgroundColor": REF_COLOR if not is_selected else "#e6f7ff",
-                "position": "sticky",
-                "left": "160px",
-                "zIndex": "1"
-            })
-            
-            ref_row.children = [index_cell, blank_info_cell, ref_label_cell]
-            
-            actual_row_style = {
-                "display": "contents",
-                "backgroundColor": ACTUAL_COLOR
-            }
-
-            if is_selected:
-                actual_row_style["backgroundColor"] = "#e6f7ff"
-            
-            actual_row = html.Div(style=actual_row_style)
-            
-            actual_label_cell = html.Div(html.Span(_('actual_label'), style={"color": "black", "fontWeight": "bold"}), style={
-                "padding": "8px",
-                "textAlign": "center",
-                "border": f"1px solid {BORDER_COLOR}",
-                "backgroundColor": ACTUAL_COLOR if not is_selected else "#e6f7ff",
-                "position": "sticky",
-                "left": "160px",
-                "zIndex": "1"
-            })
-            
-            actual_row.children = [actual_label_cell]
-            
-            # Add data cells - Remove Z values ONLY for reference midpoints
-            if tab == 'all_data':
-                ref_data_cells = []
-                actual_data_cells = []
-                
-                max_points = max(
-                    sd_data['actual_x'].shape[1] if 'actual_x' in sd_data and hasattr(sd_data['actual_x'], 'shape') else 0,
-                    bd_data['actual_x'].shape[1] if 'actual_x' in bd_data and hasattr(bd_data['actual_x'], 'shape') else 0,
-                    pd_data['actual_x'].shape[1] if 'actual_x' in pd_data and hasattr(pd_data['actual_x'], 'shape') else 0
-                )
-                
-                max_display_points = min(max_points, 25)
-                total_columns = max_display_points * 3
-
-                for j in range(max_display_points):
-                    # Add SD reference cell - Check if midpoint
-                    if j < len(sd_data['ref_x']):
-                        ref_x = sd_data['ref_x'][j]
-                        ref_z = sd_data['ref_z'][j]
-                        # Check if this is a midpoint using the is_midpoint array
-                        is_midpoint = sd_data.get('is_midpoint', [False] * len(sd_data['ref_x']))
-                        if j < len(is_midpoint) and is_midpoint[j]:
-                            # For midpoints, show only X value
-                            display_text = str(int(ref_x))
-                        else:
-                            # For regular points, show (x, z)
-                            display_text = f"({int(ref_x)}, {int(ref_z)})"
-                    else:
-                        display_text = "0"
-                    
-                    ref_data_cells.append(html.Div(
-                        display_text, 
-                        style={
-                            "padding": "8px",
-                            "textAlign": "center",
-                            "border": f"1px solid {BORDER_COLOR}",
-                            "color": "black",
-                            "minWidth": "120px",
-                            "backgroundColor": REF_COLOR if not is_selected else "#e6f7ff"
-                        }
-                    ))
-                    
-                    # Add SD actual cell - Keep (x, z) format for actual data
-                    if j < sd_data['actual_x'].shape[1] and i < sd_data['actual_x'].shape[0]:
-                        actual_x = sd_data['actual_x'][i][j]
-                        actual_z = sd_data['actual_z'][i][j]
-                        display_text = f"({int(actual_x)}, {int(actual_z)})"
-                    else:
-                        display_text = "(0, 0)"
-                    
-                    actual_data_cells.append(html.Div(
-                        display_text, 
-                        style={
-                            "padding": "8px",
-                            "textAlign": "center",
-                            "border": f"1px solid {BORDER_COLOR}",
-                            "color": "black",
-                            "minWidth": "120px",
-                            "backgroundColor": ACTUAL_COLOR if not is_selected else "#e6f7ff"
-                        }
-                    ))
-                    
-                    # Add BD reference cell - Check if midpoint
-                    if j < len(bd_data['ref_x']):
-                        ref_x = bd_data['ref_x'][j]
-                        ref_z = bd_data['ref_z'][j]
-                        # Check if this is a midpoint using the is_midpoint array
-                        is_midpoint = bd_data.get('is_midpoint', [False] * len(bd_data['ref_x']))
-                        if j < len(is_midpoint) and is_midpoint[j]:
-                            # For midpoints, show only X value
-                            display_text = str(int(ref_x))
-                        else:
-                            # For regular points, show (x, z)
-                            display_text = f"({int(ref_x)}, {int(ref_z)})"
-                    else:
-                        display_text = "0"
-                    
-                    ref_data_cells.append(html.Div(
-                        display_text, 
-                        style={
-                            "padding": "8px",
-                            "textAlign": "center",
-                            "border": f"1px solid {BORDER_COLOR}",
-                            "color": "black",
-                            "minWidth": "120px",
-                            "backgroundColor": REF_COLOR if not is_selected else "#e6f7ff"
-                        }
-                    ))
-                    
-                    # Add BD actual cell - Keep (x, z) format for actual data
-                    if j < bd_data['actual_x'].shape[1] and i < bd_data['actual_x'].shape[0]:
-                        actual_x = bd_data['actual_x'][i][j]
-                        actual_z = bd_data['actual_z'][i][j]
-                        display_text = f"({int(actual_x)}, {int(actual_z)})"
-                    else:
-                        display_text = "(0, 0)"
-                    
-                    actual_data_cells.append(html.Div(
-                        display_text, 
-                        style={
-                            "padding": "8px",
-                            "textAlign": "center",
-                            "border": f"1px solid {BORDER_COLOR}",
-                            "color": "black",
-                            "minWidth": "120px",
-                            "backgroundColor": ACTUAL_COLOR if not is_selected else "#e6f7ff"
-                        }
-                    ))
-                    
-                    # Add PD reference cell - Check if midpoint
-                    if j < len(pd_data['ref_x']):
-                        ref_x = pd_data['ref_x'][j]
-                        ref_z = pd_data['ref_z'][j]
-                        # Check if this is a midpoint using the is_midpoint array
-                        is_midpoint = pd_data.get('is_midpoint', [False] * len(pd_data['ref_x']))
-                        if j < len(is_midpoint) and is_midpoint[j]:
-                            # For midpoints, show only X value
-                            display_text = str(int(ref_x))
-                        else:
-                            # For regular points, show (x, z)
-                            display_text = f"({int(ref_x)}, {int(ref_z)})"
-                    else:
-                        display_text = "0"
-                    
-                    ref_data_cells.append(html.Div(
-                        display_text, 
-                        style={
-                            "padding": "8px",
-                            "textAlign": "center",
-                            "border": f"1px solid {BORDER_COLOR}",
-                            "color": "black",
-                            "minWidth": "120px",
-                            "backgroundColor": REF_COLOR if not is_selected else "#e6f7ff"
-                        }
-                    ))
-                    
-                    # Add PD actual cell - Keep (x, z) format for actual data
-                    if j < pd_data['actual_x'].shape[1] and i < pd_data['actual_x'].shape[0]:
-                        actual_x = pd_data['actual_x'][i][j]
-                        actual_z = pd_data['actual_z'][i][j]
-                        display_text = f"({int(actual_x)}, {int(actual_z)})"
-                    else:
-                        display_text = "(0, 0)"
-                    
-                    actual_data_cells.append(html.Div(
-                        display_text, 
-                        style={
-                            "padding": "8px",
-                            "textAlign": "center",
-                            "border": f"1px solid {BORDER_COLOR}",
-                            "color": "black",
-                            "minWidth": "120px",
-                            "backgroundColor": ACTUAL_COLOR if not is_selected else "#e6f7ff"
-                        }
-                    ))
-                
-                ref_data_container = html.Div(ref_data_cells, style={
-                    "display": "grid",
-                    "gridTemplateColumns": f"repeat({total_columns}, minmax(120px, 1fr))",
-                    "gap": "0px"
-                })
-
-                actual_data_container = html.Div(actual_data_cells, style={
-                    "display": "grid",
-                    "gridTemplateColumns": f"repeat({total_columns}, minmax(120px, 1fr))",
-                    "gap": "0px"
-                })
-                
-                ref_row.children.append(ref_data_container)
-                actual_row.children.append(actual_data_container)
-            else:
-                data = {'screwdown': sd_data, 'bending': bd_data, 'profile': pd_data}.get(tab, sd_data)
-                
-                ref_data_cells = []
-                actual_data_cells = []
-                
-                num_columns = data['actual_x'].shape[1] if 'actual_x' in data and hasattr(data['actual_x'], 'shape') else 0
-                num_display_columns = min(num_columns, 25)
-
-                for j in range(num_display_columns):
-                    # Reference cell - Check if midpoint
-                    if j < len(data['ref_x']):
-                        ref_x = data['ref_x'][j]
-                        ref_z = data['ref_z'][j]
-                        # Check if this is a midpoint using the is_midpoint array
-                        is_midpoint = data.get('is_midpoint', [False] * len(data['ref_x']))
-                        if j < len(is_midpoint) and is_midpoint[j]:
-                            # For midpoints, show only X value
-                            display_text = str(int(ref_x))
-                        else:
-                            # For regular points, show (x, z)
-                            display_text = f"({int(ref_x)}, {int(ref_z)})"
-                    else:
-                        display_text = "0"
-                    
-                    ref_data_cells.append(html.Div(
-                        display_text, 
-                        style={
-                            "padding": "8px",
-                            "textAlign": "center",
-                            "border": f"1px solid {BORDER_COLOR}",
-                            "color": "black",
-                            "minWidth": "120px",
-                            "backgroundColor": REF_COLOR if not is_selected else "#e6f7ff"
-                        }
-                    ))
-                    
-                    # Actual cell - Keep (x, z) format for actual data
-                    if j < data['actual_x'].shape[1] and i < data['actual_x'].shape[0]:
-                        actual_x = data['actual_x'][i][j]
-                        actual_z = data['actual_z'][i][j]
-                        display_text = f"({int(actual_x)}, {int(actual_z)})"
-                    else:
-                        display_text = "(0, 0)"
-                    
-                    actual_data_cells.append(html.Div(
-                        display_text, 
-                        style={
-                            "padding": "8px",
-                            "textAlign": "center",
-                            "border": f"1px solid {BORDER_COLOR}",
-                            "color": "black",
-                            "minWidth": "120px",
-                            "backgroundColor": ACTUAL_COLOR if not is_selected else "#e6f7ff"
-                        }
-                    ))
-                
-                ref_data_container = html.Div(ref_data_cells, style={
-                    "display": "grid",
-                    "gridTemplateColumns": f"repeat({num_display_columns}, minmax(120px, 1fr))",
-                    "gap": "0px"
-                })
-                
-                actual_data_container = html.Div(actual_data_cells, style={
-                    "display": "grid",
-                    "gridTemplateColumns": f"repeat({num_display_columns}, minmax(120px, 1fr))",
-                    "gap": "0px"
-                })
-                
-                ref_row.children.append(ref_data_container)
-                actual_row.children.append(actual_data_container)
-            
-            table_container.children.extend([ref_row, actual_row])
-        
-        return html.Div(
-            table_container,
-            style={
-                "overflowX": "auto",
-                "width": "100%",
-                "maxWidth": "100vw",
-                "paddingBottom": "15px",
-                "maxHeight": "70vh",
-                "overflowY": "auto",
-                "margin": "0",
-                "padding": "0"
-            }
+        # Two records per data row: reference, then actual. Both carry the row index as id,
+        # so clicking either one selects the row (handle_row_selection)
+        table_container = dash_table.DataTable(
+            id='data-table',
+            columns=list(table_columns(tuple(prefix for prefix, _data_type in series), num_display_columns)),
+            data=[],
+            fixed_columns={"headers": True, "data": 3},
+            style_table={"minWidth": "100%"},
+            style_cell=TABLE_CELL_STYLE,
+            style_cell_conditional=TABLE_CELL_CONDITIONAL,
+            style_header=TABLE_HEADER_STYLE,
+            style_data_conditional=TABLE_ROW_COLORS,
         )
+        
+        return html.Div(table_container, style=TABLE_CONTAINER_STYLE)
     except Exception as e:
         error_msg = f"Error in table: {str(e)}"
-        print(f"[ERROR] {error_msg}")
-        print(f"[ERROR] Traceback: {traceback.format_exc()}")
+        logger.exception(error_msg)
         return html.Div(error_msg, className="alert alert-danger")
 
+# Whether any row is selected; only changes when a selection starts or ends, so server
+# callbacks keyed on it do not run for every row of a navigation or auto-advance burst
+app.clientside_callback(
+    ClientsideFunction(namespace='viz', function_name='row_selected'),
+    Output('row-selected', 'data'),
+    [Input('selected-row', 'data')],
+    [State('row-selected', 'data')]
+)
+
 # Callback to show/hide zoom controls when a row is selected
 @app.callback(
     Output('zoom-controls', 'style'),
-    [Input('selected-row', 'children')]
+    [Input('row-selected', 'data')]
 )
-def toggle_zoom_controls(selected_row):
-    if not selected_row or selected_row == '-1':
+def toggle_zoom_controls(row_selected):
+    if not row_selected:
         return {"display": "none"}
     else:
         return {"display": "block"}
@@ -2413,39 +2396,47 @@ def toggle_fullscreen(n_clicks, current_state):
     [Output('graph-container', 'children'),
      Output('graph-container', 'style')],
     [Input('tabs', 'value'),
-     Input('selected-row', 'children'),
+     Input('row-selected', 'data'),
      Input('zoom-state', 'children'),
-     Input('fullscreen-state', 'children')],
+     Input('fullscreen-state', 'children'),
+     Input('applied-language', 'data')],
+    [State('selected-row', 'data'),
+     State('graph-container', 'style')],
     prevent_initial_call=False
 )
-def update_graph_container_responsive(tab, selected_row, zoom_state, fullscreen_state):
-    print(f"[DEBUG] *** GRAPH UPDATE *** tab: {tab}, row: {selected_row}, zoom: {zoom_state}")
+def update_graph_container_responsive(tab, row_selected, zoom_state, fullscreen_state, language,
+                                      selected_row, container_style):
+    logger.debug("GRAPH UPDATE - tab: %s, row: %s, zoom: %s", tab, selected_row, zoom_state)
     
-    if not selected_row or str(selected_row) == '-1':
-        print("[DEBUG] No row selected, hiding graph")
+    if selected_row is None:
+        logger.debug("No row selected, hiding graph")
         return [], {"display": "none"}
+    
+    # Once a graph is shown, zoom presets only touch its layout and row changes only swap the
+    # actual traces and relabel the fullscreen row badge (update_individual_zoom and
+    # assets/viz.js), so the row is read as state; only tab, fullscreen and language
+    # changes rebuild the section
+    triggered = [t['prop_id'].split('.')[0] for t in dash.callback_context.triggered]
+    graph_shown = (container_style or {}).get("display") == "block"
+    if graph_shown and triggered and all(t == 'zoom-state' for t in triggered):
+        return dash.no_update, dash.no_update
 
-    try:
-        selected_row_int = int(selected_row)
-        print(f"[DEBUG] Creating graph for row {selected_row_int}")
-    except (ValueError, TypeError):
-        print(f"[ERROR] Invalid selected_row: {selected_row}")
-        return [], {"display": "none"}
+    logger.debug("Creating graph for row %s", selected_row)
     
     is_fullscreen = fullscreen_state == 'true'
     
     # Force graph recreation
-    graph_content = create_graph_section(tab, selected_row_int, zoom_state, is_fullscreen)
+    graph_content = create_graph_section(tab, selected_row, zoom_state, is_fullscreen)
     
     base_style = {"display": "block", "maxWidth": "100%", "width": "100%"}
     
     if is_fullscreen:
         # Fullscreen logic (keep existing)
         blank_info_data = data_store.get('blank_info', {}).get('data', [])
-        if isinstance(blank_info_data, np.ndarray) and len(blank_info_data) > selected_row_int >= 0:
-            actual_blank_info = blank_info_data[selected_row_int]
+        if isinstance(blank_info_data, np.ndarray) and len(blank_info_data) > selected_row >= 0:
+            actual_blank_info = blank_info_data[selected_row]
         else:
-            actual_blank_info = selected_row_int + 1
+            actual_blank_info = selected_row + 1
         
         fullscreen_style = {
             **base_style,
@@ -2465,18 +2456,19 @@ def update_graph_container_responsive(tab, selected_row, zoom_state, fullscreen_
             html.Div([
                 html.Div([
                     html.Button(
-                        [html.I(className="bi bi-chevron-left me-1"), _('previous_button')],
+                        [html.I(className="bi bi-chevron-left me-1"), T.previous_button],
                         id="fullscreen-prev-row",
                         className="btn btn-outline-primary me-2",
                         style={"fontSize": "14px", "padding": "8px 16px"}
                     ),
                     html.Span(
-                        f"Row {actual_blank_info}",
+                        _('current_row', actual_blank_info),
+                        id="fullscreen-row-label",
                         className="badge bg-primary fs-6 px-3 py-2 me-2",
                         style={"fontSize": "16px", "fontWeight": "bold"}
                     ),
                     html.Button(
-                        [_('next_button'), html.I(className="bi bi-chevron-right ms-1")],
+                        [T.next_button, html.I(className="bi bi-chevron-right ms-1")],
                         id="fullscreen-next-row",
                         className="btn btn-outline-primary me-3",
                         style={"fontSize": "14px", "padding": "8px 16px", "fontWeight": "bold"}
@@ -2484,7 +2476,7 @@ def update_graph_container_responsive(tab, selected_row, zoom_state, fullscreen_
                 ], className="d-flex align-items-center"),
                 
                 html.Button(
-                    [html.I(className="bi bi-fullscreen-exit me-2"), _('exit_fullscreen')],
+                    [html.I(className="bi bi-fullscreen-exit me-2"), T.exit_fullscreen],
                     id="exit-fullscreen-button",
                     className="btn btn-danger",
                     style={"fontSize": "14px", "padding": "8px 16px", "fontWeight": "bold"}
@@ -2499,9 +2491,185 @@ def update_graph_container_responsive(tab, selected_row, zoom_state, fullscreen_
         
         return graph_content, fullscreen_style
     
-    print(f"[DEBUG] Returning graph for row {selected_row_int}")
+    logger.debug("Returning graph for row %s", selected_row)
     return graph_content, base_style
 
+# Zoom presets on an individual graph patch its axes instead of resending the traces
+@app.callback(
+    [Output('individual-graph', 'figure', allow_duplicate=True),
+     Output('individual-x-range', 'data', allow_duplicate=True)],
+    [Input('zoom-state', 'children')],
+    [State('tabs', 'value'),
+     State('selected-row', 'data')],
+    prevent_initial_call=True
+)
+def update_individual_zoom(zoom_state, tab, selected_row):
+    data = data_store.get(tab)
+    if tab == 'all_data' or not data or selected_row is None:
+        return dash.no_update, dash.no_update
+    
+    row = selected_row if 0 <= selected_row < data['actual_x'].shape[0] else 0
+    row_x, row_z = display_row(data, row)
+    zoom_ranges = tab_zoom_ranges([{'x': data['ref_x'], 'y': data['ref_z']}, {'x': row_x, 'y': row_z}],
+                                  zoom_state)
+    
+    patched_figure = Patch()
+    for axis, axis_range in zip(('xaxis', 'yaxis'), zoom_ranges or (None, None)):
+        if axis_range is None:
+            del patched_figure['layout'][axis]['range']
+            patched_figure['layout'][axis]['autorange'] = True
+        else:
+            patched_figure['layout'][axis]['range'] = axis_range
+            patched_figure['layout'][axis]['autorange'] = False
+    patched_figure['layout']['uirevision'] = f"{current_file_name}:{tab}:{zoom_state}"
+    # The preset replaces any range the user zoomed to
+    return patched_figure, None
+
+def zoomed_x_range(graph_id, relayout_data, stored_range):
+    """(x range to refine, range to store) of a graph's refine callback, or None when there is nothing to refine.
+    
+    A zoom or pan is stored; a row change or newly loaded actual-store window
+    refines the stored range again, since the clientside update put back the reduced row.
+    """
+    triggered = [t['prop_id'] for t in dash.callback_context.triggered]
+    if f'{graph_id}.relayoutData' in triggered:
+        x_range = relayout_x_range(relayout_data)
+        if x_range is None:
+            return None
+        return x_range, None if x_range == 'autorange' else list(x_range)
+    if stored_range is None:
+        return None
+    return stored_range, dash.no_update
+
+# Zooming into a reduced individual graph resends its actual trace at full resolution
+# for the visible x range; a reset goes back to the reduced whole row
+@app.callback(
+    [Output('individual-graph', 'figure', allow_duplicate=True),
+     Output('individual-x-range', 'data')],
+    [Input('individual-graph', 'relayoutData'),
+     Input('selected-row', 'data'),
+     Input('actual-store', 'modified_timestamp')],
+    [State('tabs', 'value'),
+     State('individual-x-range', 'data')],
+    prevent_initial_call=True
+)
+def refine_individual_zoom(relayout_data, selected_row, actual_modified, tab, stored_range):
+    data = data_store.get(tab)
+    zoomed = zoomed_x_range('individual-graph', relayout_data, stored_range)
+    if zoomed is None or tab == 'all_data' or not data or selected_row is None:
+        return dash.no_update, dash.no_update
+    x_range, new_range = zoomed
+    if not is_reduced(data):
+        return dash.no_update, new_range
+    
+    row = selected_row
+    if not 0 <= row < data['actual_x'].shape[0]:
+        return dash.no_update, new_range
+    logger.debug("Refining %s row %s for x range %s", tab, row, x_range)
+    row_x, row_z = visible_points(data['actual_x'][row], data['actual_z'][row], x_range)
+    
+    # The actual trace follows the reference line (_build_tab_figure); it gets its markers
+    # back once the visible range is drawn without reduction
+    reduced = x_range == 'autorange' or len(row_x) >= config.max_trace_points
+    patched_figure = Patch()
+    patched_figure['data'][1]['x'] = row_x
+    patched_figure['data'][1]['y'] = row_z
+    patched_figure['data'][1]['mode'] = actual_trace_mode(reduced)
+    return patched_figure, new_range
+
+# Same refinement for the combined graph; its x axis is shared by all traces
+@app.callback(
+    [Output('combined-graph', 'figure', allow_duplicate=True),
+     Output('combined-x-range', 'data', allow_duplicate=True)],
+    [Input('combined-graph', 'relayoutData'),
+     Input('selected-row', 'data'),
+     Input('actual-store', 'modified_timestamp')],
+    [State('combined-x-range', 'data')],
+    prevent_initial_call=True
+)
+def refine_combined_zoom(relayout_data, selected_row, actual_modified, stored_range):
+    zoomed = zoomed_x_range('combined-graph', relayout_data, stored_range)
+    if zoomed is None or not data_store or selected_row is None:
+        return dash.no_update, dash.no_update
+    x_range, new_range = zoomed
+    
+    row = selected_row
+    patched_figure = Patch()
+    refined = False
+    for index, data_type in combined_actual_traces(row):
+        data = data_store[data_type]
+        if is_reduced(data):
+            row_x, row_z = visible_points(data['actual_x'][row], data['actual_z'][row], x_range)
+            patched_figure['data'][index]['x'] = row_x
+            patched_figure['data'][index]['y'] = row_z
+            refined = True
+    
+    if not refined:
+        return dash.no_update, new_range
+    logger.debug("Refining combined row %s for x range %s", row, x_range)
+    return patched_figure, new_range
+
+# Row changes on an individual graph swap its actual trace and titles clientside (assets/viz.js)
+app.clientside_callback(
+    ClientsideFunction(namespace='viz', function_name='update_individual'),
+    [Output('individual-graph', 'figure', allow_duplicate=True),
+     Output('individual-graph-title', 'children'),
+     Output('individual-graph-subtitle', 'children')],
+    [Input('selected-row', 'data'),
+     Input('actual-store', 'data')],
+    [State('tabs', 'value'),
+     State('zoom-state', 'children'),
+     State('individual-graph', 'figure'),
+     State('ref-traces-store', 'data'),
+     State('i18n-store', 'data'),
+     State('current-language', 'children')],
+    prevent_initial_call=True
+)
+
+# Clientside callback redrawing the combined graph for the selected row and zoom preset
+app.clientside_callback(
+    ClientsideFunction(namespace='viz', function_name='update_combined'),
+    [Output('combined-graph', 'figure'),
+     Output('combined-graph-title', 'children'),
+     Output('combined-x-range', 'data')],
+    [Input('selected-row', 'data'),
+     Input('zoom-state', 'children'),
+     Input('actual-store', 'data')],
+    [State('fullscreen-state', 'children'),
+     State('ref-traces-store', 'data')]
+)
+
+# Start row of the actual-store window around the selected row; only changes when the
+# selection leaves the loaded rows
+app.clientside_callback(
+    ClientsideFunction(namespace='viz', function_name='actual_window'),
+    Output('actual-window', 'data'),
+    [Input('selected-row', 'data')],
+    [State('actual-window', 'data'),
+     State('actual-store', 'data')]
+)
+
+# Plot-ready rows of a new window; the clientside graph updates redraw once they arrive
+@app.callback(
+    Output('actual-store', 'data'),
+    [Input('actual-window', 'data')],
+    prevent_initial_call=True
+)
+def load_actual_window(start):
+    logger.debug("Loading actual rows from %s", start)
+    return create_actual_store(start)
+
+# Row badge of the fullscreen controls
+app.clientside_callback(
+    ClientsideFunction(namespace='viz', function_name='fullscreen_row_label'),
+    Output('fullscreen-row-label', 'children'),
+    [Input('selected-row', 'data')],
+    [State('actual-store', 'data'),
+     State('i18n-store', 'data'),
+     State('current-language', 'children')],
+    prevent_initial_call=True
+)
+
 # Callback to handle exit fullscreen button
 @app.callback(
     Output('fullscreen-state', 'children', allow_duplicate=True),
@@ -2513,43 +2681,49 @@ def exit_fullscreen(n_clicks):
         return 'false'
     return dash.no_update
 
-# Language switching callback
-@app.callback(
+# Language buttons relabel the static texts clientside (assets/viz.js)
+app.clientside_callback(
+    ClientsideFunction(namespace='viz', function_name='switch_language'),
     [Output('current-language', 'children'),
-     Output('url', 'pathname', allow_duplicate=True)],
+     Output('btn-lang-en', 'className'),
+     Output('btn-lang-de', 'className'),
+     Output('tab-screwdown', 'label'),
+     Output('tab-bending', 'label'),
+     Output('tab-profile', 'label'),
+     Output('tab-all-data', 'label'),
+     Output('auto-advance-checkbox', 'options'),
+     Output({'type': 'i18n-text', 'key': ALL, 'index': ALL}, 'children'),
+     Output({'type': 'i18n-title', 'key': ALL}, 'title')],
     [Input('btn-lang-en', 'n_clicks'),
      Input('btn-lang-de', 'n_clicks')],
-    [State('url', 'pathname')],
+    [State('i18n-store', 'data'),
+     State({'type': 'i18n-text', 'key': ALL, 'index': ALL}, 'children'),
+     State({'type': 'i18n-title', 'key': ALL}, 'title')],
     prevent_initial_call=True
 )
-def switch_language_callback(en_clicks, de_clicks, pathname):
-    global LANGUAGE
-    
-    ctx = dash.callback_context
-    if not ctx.triggered:
-        return dash.no_update, dash.no_update
 
-    button_id = ctx.triggered[0]['prop_id'].split('.')[0]
+# Apply the new language server-side; the server-rendered parts of the page redraw on applied-language
+@app.callback(
+    [Output('applied-language', 'data'),
+     Output('ref-traces-store', 'data')],
+    [Input('current-language', 'children')],
+    prevent_initial_call=True
+)
+def switch_language_callback(language):
+    if language == LANGUAGE:
+        return dash.no_update, dash.no_update
     
-    print(f"[INFO] Language button clicked: {button_id}")
-
-    if button_id == 'btn-lang-en':
-        switch_language('en')
-        print(f"[INFO] Language switched to English")
-        return 'en', pathname
-    elif button_id == 'btn-lang-de':
-        switch_language('de')
-        print(f"[INFO] Language switched to German")
-        return 'de', pathname
-
-    return dash.no_update, dash.no_update
+    switch_language(language)
+    # Axis titles and the graph title of the combined graph are baked into its reference store
+    return language, create_ref_traces_store()
 
 # Callback to conditionally show coil dropdown
 @app.callback(
     Output('coil-selection-container', 'children'),
-    [Input('url', 'pathname')]
+    [Input('url', 'pathname'),
+     Input('applied-language', 'data')]
 )
-def update_coil_dropdown_visibility(pathname):
+def update_coil_dropdown_visibility(pathname, language):
     global available_coils, selected_coil
     
     if not current_file_name or not available_coils:
@@ -2558,7 +2732,7 @@ def update_coil_dropdown_visibility(pathname):
     # Only show dropdown if there are multiple coils
     if len(available_coils) > 1:
         return html.Div([
-            html.Label(_('coil_selection'), className="me-2", style={"fontWeight": "bold"}),
+            html.Label(T.coil_selection, className="me-2", style={"fontWeight": "bold"}),
             dcc.Dropdown(
                 id='coil-dropdown',
                 options=[{'label': coil, 'value': coil} for coil in available_coils],
@@ -2571,7 +2745,7 @@ def update_coil_dropdown_visibility(pathname):
         # If only one coil, show it as text (no dropdown needed)
         if available_coils:
             return html.Div([
-                html.Label(_('coil_selection'), className="me-2", style={"fontWeight": "bold"}),
+                html.Label(T.coil_selection, className="me-2", style={"fontWeight": "bold"}),
                 html.Span(available_coils[0], className="badge bg-primary fs-6 px-3 py-2")
             ], className="d-flex align-items-center")
         else:
@@ -2611,79 +2785,77 @@ def update_auto_advance_state(checkbox_value):
     is_checked = 'auto_advance' in (checkbox_value or [])
     auto_advance_state = 'true' if is_checked else 'false'
     
-    print(f"[DEBUG] Auto-advance checkbox changed: {is_checked}, state: {auto_advance_state}")
+    logger.debug("Auto-advance checkbox changed: %s, state: %s", is_checked, auto_advance_state)
     
     return auto_advance_state
 
-# Interval control for auto-advance
-@app.callback(
+# Interval control for auto-advance: ticks only while enabled and a row is selected
+app.clientside_callback(
+    ClientsideFunction(namespace='viz', function_name='auto_advance_disabled'),
     Output('auto-advance-interval', 'disabled'),
     [Input('auto-advance-state', 'children'),
-     Input('selected-row', 'children')]
+     Input('selected-row', 'data')]
 )
-def control_auto_advance_interval(auto_advance_state, selected_row):
-    should_disable = not (auto_advance_state == 'true' and selected_row and selected_row != '-1')
-    print(f"[DEBUG] Interval disabled: {should_disable}, auto_advance_state: {auto_advance_state}, selected_row: {selected_row}")
-    return should_disable
 
-# Callback to update auto-advance status indicator
-@app.callback(
-    Output('auto-advance-status', 'children'),
+# Auto-advance step, run in the browser so a tick never waits on the server
+app.clientside_callback(
+    ClientsideFunction(namespace='viz', function_name='auto_advance_step'),
+    Output('selected-row', 'data', allow_duplicate=True),
+    [Input('auto-advance-interval', 'n_intervals')],
+    [State('auto-advance-state', 'children'),
+     State('selected-row', 'data'),
+     State('max-row', 'data')],
+    prevent_initial_call=True
+)
+
+# Auto-advance status indicator
+app.clientside_callback(
+    ClientsideFunction(namespace='viz', function_name='auto_advance_status'),
+    [Output('auto-advance-status', 'children'),
+     Output('auto-advance-status', 'style')],
     [Input('auto-advance-state', 'children'),
-     Input('selected-row', 'children')]
+     Input('selected-row', 'data')]
 )
-def update_auto_advance_status(auto_advance_state, selected_row):
-    if auto_advance_state == 'true':
-        if selected_row and selected_row != '-1':
-            return html.Span("🔄 Auto-advancing...", style={"color": "#28a745"})
-        else:
-            return html.Span("⏸️ Select a row to start", style={"color": "#ffc107"})
-    else:
-        return html.Span("⏹️ Auto-advance off", style={"color": "#6c757d"})
 
 # Callback for fullscreen navigation controls
 @app.callback(
-    Output('selected-row', 'children', allow_duplicate=True),
+    Output('selected-row', 'data', allow_duplicate=True),
     [Input('fullscreen-prev-row', 'n_clicks'),
      Input('fullscreen-next-row', 'n_clicks')],
-    [State('selected-row', 'children'),
-     State('max-row', 'children')],
+    [State('selected-row', 'data'),
+     State('max-row', 'data')],
     prevent_initial_call=True
 )
 def handle_fullscreen_navigation(prev_clicks, next_clicks, current_row, max_row):
     ctx = dash.callback_context
-    if not ctx.triggered or not current_row or current_row == '-1':
+    if not ctx.triggered or current_row is None:
         return dash.no_update
     
-    current_row_int = int(current_row)
-    max_row_int = int(max_row) if max_row else 0
-    
     button_id = ctx.triggered[0]['prop_id'].split('.')[0]
     
     if button_id == 'fullscreen-prev-row' and prev_clicks:
-        new_row = max(0, current_row_int - 1)
-        print(f"[DEBUG] Fullscreen previous: {current_row_int} -> {new_row}")
-        return str(new_row)
+        new_row = max(0, current_row - 1)
+        logger.debug("Fullscreen previous: %s -> %s", current_row, new_row)
+        return new_row
     elif button_id == 'fullscreen-next-row' and next_clicks:
-        new_row = min(max_row_int - 1, current_row_int + 1)
-        print(f"[DEBUG] Fullscreen next: {current_row_int} -> {new_row}")
-        return str(new_row)
+        new_row = min(max_row - 1, current_row + 1)
+        logger.debug("Fullscreen next: %s -> %s", current_row, new_row)
+        return new_row
     
     return dash.no_update
 
 # Add this new callback after the existing callbacks
 @app.callback(
-    Output('selected-row', 'children', allow_duplicate=True),
+    Output('selected-row', 'data', allow_duplicate=True),
     [Input('tabs', 'value')],
-    [State('max-row', 'children')],
+    [State('max-row', 'data')],
     prevent_initial_call=True
 )
 def initialize_first_row(tab, max_row):
     """Initialize to first row when tab changes or data loads"""
-    max_row_int = int(max_row) if max_row else 0
-    if max_row_int > 0:
-        print(f"[DEBUG] Initializing to first row for tab: {tab}")
-        return "0"
+    if max_row:
+        logger.debug("Initializing to first row for tab: %s", tab)
+        return 0
     return dash.no_update
 
 # Main entry point
@@ -2708,5 +2880,14 @@ if __name__ == '__main__':
     else:
         print("[WARNING] No H5 files found.")
 
+    # Dash serializes callback responses with orjson automatically when it is installed
+    try:
+        import orjson  # noqa: F401
+        print("[INFO] orjson available, used for callback JSON serialization")
+    except ImportError:
+        print("[INFO] orjson not installed; 'pip install orjson' speeds up figure serialization")
+    if not COMPRESS_RESPONSES:
+        print("[INFO] flask-compress not installed; 'pip install flask-compress' gzips callback responses")
+
     print("[INFO] Starting Dash application on http://127.0.0.1:5000")
     app.run(host='127.0.0.1', port=5000, debug=False)
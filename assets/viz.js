@@ -0,0 +1,367 @@
+// Clientside callbacks for the visualization page. Dash loads every script in
+// assets/ automatically; the functions are looked up by namespace and name from
+// ClientsideFunction in app.py.
+
+// Blank info is numbered consecutively (generate_coil_blank_info), so the
+// stores only carry its first number and count (blank_info_range in app.py).
+
+// Blank info number of a row, or its 1-based index when it has none.
+function blankInfoLabel(blankInfo, row) {
+    return (blankInfo && row >= 0 && row < blankInfo.count) ? blankInfo.first + row : row + 1;
+}
+
+// Row of a blank info number, or -1.
+function blankInfoRow(blankInfo, target) {
+    const row = target - blankInfo.first;
+    return (row >= 0 && row < blankInfo.count) ? row : -1;
+}
+
+// Index of a row inside the actual-store window, or -1 when the window does
+// not hold it (create_actual_store in app.py).
+function windowRow(actualData, row) {
+    const index = row - actualData.start;
+    return (index >= 0 && index < actualData.window_rows) ? index : -1;
+}
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    viz: {
+        // Combined graph for the selected row: static reference traces from
+        // ref-traces-store plus the row's actual traces from actual-store.
+        // Mirrors create_combined_graph / combined_graph_layout in app.py. Rows
+        // outside the loaded window wait for load_actual_window. The actual traces
+        // are the reduced rows; refine_combined_zoom in app.py redraws them at full
+        // resolution for a zoomed x range, which a zoom preset clears.
+        update_combined: function(selectedRow, zoomState, actualData, fullscreenState, refTraces) {
+            const noUpdate = window.dash_clientside.no_update;
+            const triggered = window.dash_clientside.callback_context.triggered || [];
+            const presetChanged = triggered.some(function(t) {
+                return t.prop_id === 'zoom-state.children';
+            });
+            const xRange = presetChanged ? null : noUpdate;
+            if (!refTraces || !actualData || selectedRow === null) {
+                return [noUpdate, noUpdate, xRange];
+            }
+
+            const row = selectedRow;
+            const index = windowRow(actualData, row);
+            if (index < 0) {
+                return [noUpdate, noUpdate, xRange];
+            }
+            const isFullscreen = fullscreenState === 'true';
+
+            const traces = [];
+            refTraces.groups.forEach(function(group) {
+                group.ref_traces.forEach(function(trace) {
+                    traces.push(trace);
+                });
+                const rows = actualData.actual[group.data_type];
+                if (rows && index < rows.x.length) {
+                    traces.push(Object.assign({}, group.actual_trace, {x: rows.x[index], y: rows.z[index]}));
+                }
+            });
+
+            const layout = JSON.parse(JSON.stringify(refTraces.layout));
+            const fontSize = isFullscreen ? 12 : 10;
+            layout.height = isFullscreen ? 700 : 400;
+            layout.font = Object.assign({}, layout.font, {size: fontSize});
+            layout.legend = Object.assign({}, layout.legend, {font: {size: fontSize}});
+            layout.uirevision = refTraces.file_name + ':all_data:' + zoomState;
+
+            const ranges = refTraces.zoom_ranges[zoomState];
+            ['xaxis', 'yaxis', 'yaxis2'].forEach(function(axis) {
+                if (zoomState === 'auto') {
+                    layout[axis].autorange = true;
+                } else if (ranges) {
+                    layout[axis].range = ranges[axis];
+                }
+            });
+
+            const label = blankInfoLabel(actualData.blank_info, row);
+
+            return [{data: traces, layout: layout}, refTraces.title.replace('{0}', label), xRange];
+        },
+
+        // Row change on an individual tab graph: swap the actual trace (index 1,
+        // after the reference line, see _build_tab_figure in app.py) for the
+        // row from actual-store and re-centre the zoom_in/zoom_out window. The
+        // row is the reduced one; refine_individual_zoom in app.py redraws it at
+        // full resolution when the user has zoomed in.
+        update_individual: function(selectedRow, actualData, tab, zoomState, figure,
+                                    refTraces, i18nTexts, language) {
+            const noUpdate = window.dash_clientside.no_update;
+            const rows = actualData && actualData.actual[tab];
+            if (!rows || !figure || !refTraces || selectedRow === null) {
+                return [noUpdate, noUpdate, noUpdate];
+            }
+
+            const selected = selectedRow;
+            const index = windowRow(actualData, selected);
+            if (index < 0 || index >= rows.x.length) {
+                return [noUpdate, noUpdate, noUpdate];
+            }
+
+            const data = figure.data.slice();
+            data[1] = Object.assign({}, data[1], {x: rows.x[index], y: rows.z[index], mode: rows.mode});
+            const layout = Object.assign({}, figure.layout);
+
+            // Same window as tab_zoom_ranges in app.py
+            if (zoomState === 'zoom_in' || zoomState === 'zoom_out') {
+                const factor = zoomState === 'zoom_in' ? 0.375 : 0.625;
+                let xMin = Infinity, xMax = -Infinity, yMin = Infinity, yMax = -Infinity;
+                [data[0], data[1]].forEach(function(trace) {
+                    for (let i = 0; i < trace.x.length; i++) {
+                        xMin = Math.min(xMin, trace.x[i]);
+                        xMax = Math.max(xMax, trace.x[i]);
+                    }
+                    for (let i = 0; i < trace.y.length; i++) {
+                        yMin = Math.min(yMin, trace.y[i]);
+                        yMax = Math.max(yMax, trace.y[i]);
+                    }
+                });
+                const xCenter = (xMin + xMax) / 2, yCenter = (yMin + yMax) / 2;
+                layout.xaxis = Object.assign({}, layout.xaxis, {
+                    range: [xCenter - (xMax - xMin) * factor, xCenter + (xMax - xMin) * factor]
+                });
+                layout.yaxis = Object.assign({}, layout.yaxis, {
+                    range: [yCenter - (yMax - yMin) * factor, yCenter + (yMax - yMin) * factor]
+                });
+            }
+
+            const label = blankInfoLabel(actualData.blank_info, selected);
+            const texts = (i18nTexts && i18nTexts[language]) || {};
+            const tabTitle = refTraces.tab_titles[tab];
+            const format = function(template) {
+                return String(template || '').replace('{0}', tabTitle).replace('{1}', label);
+            };
+
+            return [{data: data, layout: layout}, format(texts.graph_title), format(texts.actual_vs_ref)];
+        },
+
+        // Previous/next row and jump to a blank info number, clamped to the
+        // loaded rows; without a selection, stepping starts from the first row.
+        navigate_row: function(prevClicks, nextClicks, jumpClicks, jumpValue, currentRow, maxRow, actualData) {
+            const noUpdate = window.dash_clientside.no_update;
+            const triggered = window.dash_clientside.callback_context.triggered;
+            if (!triggered || !triggered.length) {
+                return noUpdate;
+            }
+            const triggerId = triggered[0].prop_id.split('.')[0];
+
+            if (maxRow <= 0) {
+                return noUpdate;
+            }
+            const current = currentRow === null ? 0 : currentRow;
+
+            let newRow = current;
+            if (triggerId === 'jump-previous-button') {
+                newRow = Math.max(0, current - 1);
+            } else if (triggerId === 'jump-next-button') {
+                newRow = Math.min(maxRow - 1, current + 1);
+            } else if (triggerId === 'jump-to-row-button') {
+                // The number input gives null while it is empty
+                if (!Number.isInteger(jumpValue)) {
+                    return noUpdate;
+                }
+                const blankInfo = actualData && actualData.blank_info;
+                // Without blank info the input is a 1-based row number
+                newRow = (blankInfo && blankInfo.count > 0) ? blankInfoRow(blankInfo, jumpValue) : jumpValue - 1;
+                if (newRow < 0 || newRow >= maxRow) {
+                    return noUpdate;
+                }
+            }
+
+            return newRow !== currentRow ? newRow : noUpdate;
+        },
+
+        // Row badge: the selected row's blank info number, or its 1-based index.
+        row_display: function(selectedRow, language, actualData, i18nTexts) {
+            const texts = (i18nTexts && i18nTexts[language]) || {};
+            const row = selectedRow === null ? 0 : selectedRow;
+            const label = blankInfoLabel(actualData && actualData.blank_info, row);
+            return String(texts.current_row || '').replace('{0}', label);
+        },
+
+        // Table page: the selected row's page, page 1 on a tab change, or one
+        // page back/forward clamped to the loaded rows.
+        update_page: function(prevClicks, nextClicks, tab, selectedRow, maxRow, currentPage, pageSize) {
+            const noUpdate = window.dash_clientside.no_update;
+            const triggered = window.dash_clientside.callback_context.triggered;
+            if (!triggered || !triggered.length) {
+                return noUpdate;
+            }
+            const triggerId = triggered[0].prop_id.split('.')[0];
+
+            const maxPages = maxRow > 0 ? Math.ceil(maxRow / pageSize) : 1;
+
+            let page = currentPage;
+            if (triggerId === 'tabs') {
+                page = 1;
+            } else if (triggerId === 'selected-row' && selectedRow !== null) {
+                page = Math.floor(selectedRow / pageSize) + 1;
+            } else if (triggerId === 'prev-button' && prevClicks) {
+                page = Math.max(1, currentPage - 1);
+            } else if (triggerId === 'next-button' && nextClicks) {
+                page = Math.min(currentPage + 1, maxPages);
+            }
+            return page !== currentPage ? page : noUpdate;
+        },
+
+        // Records of the visible page, two per row (reference, then actual), and
+        // the selected-row highlight, read from table-store and the page values in
+        // table-cells (create_table_store / create_table_cells in app.py).
+        table_records: function(pageCells, selectedRow, language, tab, pageSize, table, i18nTexts) {
+            const noUpdate = window.dash_clientside.no_update;
+            if (!table || !pageCells) {
+                return [noUpdate, noUpdate, noUpdate, noUpdate];
+            }
+            const texts = (i18nTexts && i18nTexts[language]) || {};
+            const series = table.series[tab] || table.series.screwdown;
+            const columns = table.display_columns[tab] || 0;
+            const start = pageCells.start;
+            const end = Math.min(start + pageSize, table.max_rows);
+
+            // Reference cells are the same on every row
+            const refCells = {};
+            series.forEach(function(entry) {
+                const refDisplay = table.ref_display[entry[1]] || [];
+                for (let j = 0; j < columns; j++) {
+                    refCells[entry[0] + j] = j < refDisplay.length ? refDisplay[j] : '0';
+                }
+            });
+
+            const records = [];
+            for (let i = start; i < end; i++) {
+                const refRecord = Object.assign({
+                    id: i,
+                    index: i === selectedRow ? '✓' : String(i + 1),
+                    blank_info: String(blankInfoLabel(table.blank_info, i)),
+                    values: texts.ref_label
+                }, refCells);
+                const actualRecord = {id: i, index: '', blank_info: '', values: texts.actual_label};
+
+                // Points or rows missing from a series show as (0, 0)
+                series.forEach(function(entry) {
+                    const cells = pageCells.cells[entry[1]];
+                    const x = cells && i - start < cells.x.length ? cells.x[i - start] : [];
+                    const z = cells && i - start < cells.z.length ? cells.z[i - start] : [];
+                    for (let j = 0; j < columns; j++) {
+                        actualRecord[entry[0] + j] = j < x.length ? '(' + x[j] + ', ' + z[j] + ')' : '(0, 0)';
+                    }
+                });
+                records.push(refRecord, actualRecord);
+            }
+
+            // Later rules win, so the selected row overrides the series colors
+            let styles = table.row_colors;
+            if (selectedRow !== null && selectedRow >= start && selectedRow < end) {
+                const selectedIndex = 2 * (selectedRow - start);
+                styles = table.row_colors.concat([selectedIndex, selectedIndex + 1].map(function(rowIndex) {
+                    return {'if': {row_index: rowIndex}, backgroundColor: table.selected_color};
+                }));
+            }
+            // Clear the clicked cell, so clicking it again after the row moved
+            // elsewhere changes active_cell and selects it (handle_row_selection)
+            return [records, styles, null, []];
+        },
+
+        // Row badge of the fullscreen controls, like the one built in
+        // update_graph_container_responsive.
+        fullscreen_row_label: function(selectedRow, actualData, i18nTexts, language) {
+            if (selectedRow === null) {
+                return window.dash_clientside.no_update;
+            }
+            const texts = (i18nTexts && i18nTexts[language]) || {};
+            const label = blankInfoLabel(actualData && actualData.blank_info, selectedRow);
+            return String(texts.current_row || '').replace('{0}', label);
+        },
+
+        // First row of the actual-store window around the selected row, requested
+        // only once the row is outside the loaded one. The window starts one row
+        // early so stepping back is loaded too.
+        actual_window: function(selectedRow, current, actualData) {
+            const noUpdate = window.dash_clientside.no_update;
+            if (!actualData || selectedRow === null || windowRow(actualData, selectedRow) >= 0) {
+                return noUpdate;
+            }
+            const start = Math.max(0, selectedRow - 1);
+            return start !== current ? start : noUpdate;
+        },
+
+        // Whether a row is selected, updated only when that changes.
+        row_selected: function(selectedRow, current) {
+            const selected = selectedRow !== null;
+            return selected !== current ? selected : window.dash_clientside.no_update;
+        },
+
+        // Page label and disabled flags of the prev/next page buttons.
+        page_controls: function(page, maxRow, language, pageSize, i18nTexts) {
+            const texts = (i18nTexts && i18nTexts[language]) || {};
+            const maxPages = maxRow > 0 ? Math.ceil(maxRow / pageSize) : 1;
+            return [texts.page + ' ' + page + ' ' + texts.of + ' ' + maxPages,
+                    page <= 1, page >= maxPages];
+        },
+
+        // The auto-advance interval only ticks while enabled and a row is selected.
+        auto_advance_disabled: function(autoAdvanceState, selectedRow) {
+            return !(autoAdvanceState === 'true' && selectedRow !== null);
+        },
+
+        // One auto-advance tick: next row, wrapping around after the last one.
+        auto_advance_step: function(nIntervals, autoAdvanceState, currentRow, maxRow) {
+            const noUpdate = window.dash_clientside.no_update;
+            if (autoAdvanceState !== 'true' || maxRow <= 0 || currentRow === null) {
+                return noUpdate;
+            }
+            const newRow = (currentRow + 1) % maxRow;
+            return newRow !== currentRow ? newRow : noUpdate;
+        },
+
+        auto_advance_status: function(autoAdvanceState, selectedRow) {
+            const style = {fontSize: '14px', fontWeight: 'bold'};
+            if (autoAdvanceState !== 'true') {
+                return ['⏹️ Auto-advance off', Object.assign(style, {color: '#6c757d'})];
+            }
+            if (selectedRow !== null) {
+                return ['🔄 Auto-advancing...', Object.assign(style, {color: '#28a745'})];
+            }
+            return ['⏸️ Select a row to start', Object.assign(style, {color: '#ffc107'})];
+        },
+
+        // Language buttons: relabel the static texts and tooltips (the i18n-text and
+        // i18n-title spans of i18n_text / i18n_title in app.py) through callback
+        // outputs. The server applies the language from current-language.
+        switch_language: function(enClicks, deClicks, i18nTexts, labels, titles) {
+            const noUpdate = window.dash_clientside.no_update;
+            const context = window.dash_clientside.callback_context;
+            const triggered = context.triggered;
+            if (!triggered || !triggered.length || !i18nTexts) {
+                return Array(10).fill(noUpdate);
+            }
+            const language = triggered[0].prop_id.split('.')[0] === 'btn-lang-de' ? 'de' : 'en';
+            const texts = i18nTexts[language];
+            // The span ids carry the text keys, in the same order as the outputs
+            const relabel = function(states) {
+                return states.map(function(state) {
+                    const text = texts[state.id.key];
+                    return text !== undefined ? text : state.value;
+                });
+            };
+
+            const buttonClass = function(buttonLanguage) {
+                return buttonLanguage === language ? 'btn-primary' : 'btn-outline-primary';
+            };
+            return [
+                language,
+                'btn btn-sm me-1 ' + buttonClass('en'),
+                'btn btn-sm ' + buttonClass('de'),
+                texts.tab_screwdown,
+                texts.tab_bending,
+                texts.tab_profile,
+                texts.tab_all_data,
+                [{label: texts.auto_advance, value: 'auto_advance'}],
+                relabel(context.states_list[1]),
+                relabel(context.states_list[2])
+            ];
+        }
+    }
+});